@@ -12,12 +12,16 @@ this module. Override by setting _MIGRATIONS_PATH or passing migrations_path.
 Compatible with Jython 2.7 and CPython 2.7+/3.x.
 """
 
+import copy
 import json
 import os
 
 # set this to the path of the patch file (../schemas/current/patch.json, relative to this script)
 _MIGRATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "schemas", "current", "patch.json")
 
+# parsed patch files, reused while unchanged: path -> (mtime, migrations)
+_migrations_cache = {}
+
 
 def _parse_path(path):
     """Split a JSON Pointer string into segments, handling '/' and '~' escaping."""
@@ -77,7 +81,8 @@ def _ensure_parents(data, segments):
 def _apply_set(data, op):
     segments = _parse_path(op["path"])
     parent, key = _ensure_parents(data, segments)
-    parent[key] = op["value"]
+    # copy so samples never share (and mutate) the cached patch value
+    parent[key] = copy.deepcopy(op["value"])
 
 
 def _apply_remove(data, op):
@@ -138,10 +143,17 @@ def _get_version(data):
 
 
 def _load_migrations(path=None):
+    """Load the patch file, re-reading it only when its mtime changes."""
     if path is None:
         path = _MIGRATIONS_PATH
+    mtime = os.path.getmtime(path)
+    cached = _migrations_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     with open(path, "r") as f:
-        return json.load(f)
+        migrations = json.load(f)
+    _migrations_cache[path] = (mtime, migrations)
+    return migrations
 
 
 def update_to_latest_schema(data, migrations_path=None):
@@ -15,12 +15,33 @@ try:
 except ImportError:
     MIGRATION_AVAILABLE = False
 
+# Bound on the number of parsed sample files kept by each SampleIO
+_SAMPLE_CACHE_SIZE = 512
+
+
+def _copy_json(value):
+    """Copy parsed JSON (nested dicts and lists) so callers can't modify cached data"""
+    if isinstance(value, dict):
+        return dict((key, _copy_json(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
 
 class SampleIO:
     """Handle reading/writing sample JSON files with proper timestamping"""
 
     def __init__(self, schema_version="0.1.0"):
         self.schema_version = schema_version
+        # Caches are keyed by file stamp, see file_stamp
+        # Sample status by file: filepath -> (stamp, status)
+        self._status_cache = {}
+        # Parsed samples by file: (filepath, migrate) -> (stamp, data)
+        self._sample_cache = {}
+        # Sample summaries by file: filepath -> (stamp, summary)
+        self._summary_cache = {}
+        # Functions called with a filepath when invalidate drops it
+        self._invalidate_listeners = []
 
     @staticmethod
     def generate_filename(sample_label, timestamp=None):
@@ -78,6 +99,12 @@ class SampleIO:
         except ValueError:
             return None, None
 
+    @staticmethod
+    def file_stamp(filepath):
+        """Get (mtime, size) for a file - cached data is reused while this is unchanged"""
+        st = os.stat(filepath)
+        return (st.st_mtime, st.st_size)
+
     def read_sample(self, filepath, migrate=True):
         """
         Read sample JSON file and optionally migrate to latest schema
@@ -85,24 +112,89 @@ class SampleIO:
         Args:
             filepath: Path to JSON file
             migrate: If True, automatically migrate to latest schema version
+
+        Parsed samples are cached by file mtime and size, so unchanged files
+        are not re-read. Each call returns its own copy of the data.
         """
+        return _copy_json(self._read_cached(filepath, migrate)[1])
+
+    def _read_cached(self, filepath, migrate=True):
+        """
+        Read and parse a sample file through the cache
+
+        Returns (stamp, data) - data is shared with the cache, so must not be modified
+        """
+        key = (filepath, migrate)
         try:
+            stamp = self.file_stamp(filepath)
+            cached = self._sample_cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached
+
             with open(filepath, 'r') as f:
-                data = json.load(f)
-
-            # Apply migration if available and requested
-            if migrate and MIGRATION_AVAILABLE:
-                try:
-                    data = update_to_latest_schema(data)
-                except Exception as e:
-                    # Log migration error but still return data
-                    # Don't fail the read operation
-                    pass
-
-            return data
-        except (IOError, ValueError) as e:
+                text = f.read()
+            data = self._parse_sample(text, migrate)
+        except (IOError, OSError, ValueError) as e:
             raise Exception("Failed to read sample file %s: %s" % (filepath, str(e)))
 
+        if len(self._sample_cache) >= _SAMPLE_CACHE_SIZE:
+            self._sample_cache.clear()
+        cached = (stamp, data)
+        self._sample_cache[key] = cached
+        return cached
+
+    def read_summary(self, filepath):
+        """
+        Read the fields of a sample shown in lists and the status badge
+
+        Returns dict with 'status', 'label' (None if unset), 'created',
+        'modified' and 'ejected' timestamps ('' if unset) and 'users'.
+        Summaries are cached by file mtime and size and shared between
+        callers, so must not be modified.
+        """
+        try:
+            stamp = self.file_stamp(filepath)
+        except OSError as e:
+            raise Exception("Failed to read sample file %s: %s" % (filepath, str(e)))
+        cached = self._summary_cache.get(filepath)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        stamp, data = self._read_cached(filepath)
+        metadata = data.get('metadata', {})
+        status = self.get_status_from_data(data)
+        summary = {
+            'status': status,
+            'label': data.get('sample', {}).get('label'),
+            'created': metadata.get('created_timestamp', ''),
+            'modified': metadata.get('modified_timestamp', ''),
+            'ejected': metadata.get('ejected_timestamp', ''),
+            'users': data.get('people', {}).get('users', []),
+        }
+
+        if len(self._summary_cache) >= _SAMPLE_CACHE_SIZE:
+            self._summary_cache.clear()
+        self._summary_cache[filepath] = (stamp, summary)
+        # Remember status for later get_sample_status calls
+        self._status_cache[filepath] = (stamp, status)
+        return summary
+
+    @staticmethod
+    def _parse_sample(text, migrate=True):
+        """Parse sample JSON text and optionally migrate to latest schema"""
+        data = json.loads(text)
+
+        # Apply migration if available and requested
+        if migrate and MIGRATION_AVAILABLE:
+            try:
+                data = update_to_latest_schema(data)
+            except Exception as e:
+                # Log migration error but still return data
+                # Don't fail the read operation
+                pass
+
+        return data
+
     def write_sample(self, filepath, data, is_new=False):
         """
         Write sample JSON file with proper metadata timestamps
@@ -131,6 +223,32 @@ class SampleIO:
                 json.dump(data, f, indent=2)
         except IOError as e:
             raise Exception("Failed to write sample file %s: %s" % (filepath, str(e)))
+        finally:
+            # File may have changed within the mtime resolution, so don't trust the caches
+            self.invalidate(filepath)
+
+    def delete_sample(self, filepath):
+        """Delete a sample file, dropping anything cached for it"""
+        try:
+            os.remove(filepath)
+        finally:
+            self.invalidate(filepath)
+
+    def invalidate(self, filepath):
+        """Drop cached status, data and summary for a sample file"""
+        self._status_cache.pop(filepath, None)
+        self._sample_cache.pop((filepath, True), None)
+        self._sample_cache.pop((filepath, False), None)
+        self._summary_cache.pop(filepath, None)
+        for listener in self._invalidate_listeners:
+            listener(filepath)
+
+    def add_invalidate_listener(self, listener):
+        """
+        Call listener(filepath) whenever a sample file is written, ejected or
+        deleted, so caches kept outside SampleIO can drop it too
+        """
+        self._invalidate_listeners.append(listener)
 
     def eject_sample(self, filepath):
         """Add ejected timestamp to sample"""
@@ -149,17 +267,57 @@ class SampleIO:
         """
         Check if sample is loaded (active) or ejected
         Returns: 'loaded', 'ejected', or 'unknown'
+
+        Status is cached by file mtime and size, so unchanged files are not
+        re-read. Files that can't be parsed are 'unknown'.
         """
         try:
-            data = self.read_sample(filepath)
+            stamp = self.file_stamp(filepath)
+        except OSError:
+            return 'unknown'
 
-            if 'metadata' in data and data['metadata'].get('ejected_timestamp'):
-                return 'ejected'
-            else:
-                return 'loaded'  # Active/loaded sample
+        cached = self._status_cache.get(filepath)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            # Parsed through the sample cache, so a later read_sample is free
+            status = self.get_status_from_data(self._read_cached(filepath)[1])
         except Exception:
             return 'unknown'
 
+        self._status_cache[filepath] = (stamp, status)
+        return status
+
+    @staticmethod
+    def get_status_from_data(data):
+        """
+        Get sample status from already-loaded sample data
+        Returns: 'loaded' or 'ejected'
+        """
+        if 'metadata' in data and data['metadata'].get('ejected_timestamp'):
+            return 'ejected'
+        else:
+            return 'loaded'  # Active/loaded sample
+
+    def list_sample_summaries(self, directory):
+        """
+        List sample files in directory with their summaries (see read_summary)
+
+        Returns list of (filename, filepath, summary) tuples sorted
+        chronologically; summary is None if a file can't be read
+        """
+        samples = []
+
+        for filename, filepath in self.list_sample_paths(directory):
+            try:
+                summary = self.read_summary(filepath)
+            except Exception:
+                summary = None
+            samples.append((filename, filepath, summary))
+
+        return samples
+
     @staticmethod
     def list_sample_files(directory):
         """
@@ -185,16 +343,26 @@ class SampleIO:
 
         return sample_files
 
+    @staticmethod
+    def list_sample_paths(directory):
+        """
+        List all sample JSON files in directory with their full paths
+        Returns list of (filename, filepath) tuples, sorted chronologically
+        """
+        # Join the directory once rather than once per file
+        prefix = os.path.join(directory, '')
+        return [(filename, prefix + filename)
+                for filename in SampleIO.list_sample_files(directory)]
+
     def find_active_sample(self, directory):
         """
         Find the active sample in directory (most recent without ejected_timestamp)
         Returns: filename or None
         """
-        sample_files = self.list_sample_files(directory)
+        sample_paths = self.list_sample_paths(directory)
 
         # Check from most recent backwards
-        for filename in reversed(sample_files):
-            filepath = os.path.join(directory, filename)
+        for filename, filepath in reversed(sample_paths):
             status = self.get_sample_status(filepath)
             if status == 'loaded':  # Active sample
                 return filename
@@ -6,11 +6,19 @@ Efficiently scans directory trees for NMR sample JSON files
 
 import os
 import json
+import threading
+import time
 
 
 class SampleScanner:
     """Scan directory trees for sample files with optimization"""
 
+    # Minimum seconds between progress reports during a scan
+    PROGRESS_INTERVAL = 0.25
+
+    # Most root directories scanned at once - each is an independent tree
+    MAX_SCAN_THREADS = 8
+
     def __init__(self, sample_io):
         """Initialize scanner
 
@@ -18,24 +26,117 @@ class SampleScanner:
             sample_io: SampleIO instance for file operations
         """
         self.sample_io = sample_io
-
-    def scan_roots(self, root_directories):
+        # Results by sample file from the last scan: filepath -> (stamp, (is_sample, sample_info)),
+        # where stamp is SampleIO.file_stamp (mtime, size)
+        self._file_cache = {}
+        self._previous_cache = {}
+        # Files written through sample_io may keep their mtime, so drop them explicitly
+        sample_io.add_invalidate_listener(self.invalidate)
+        # Scans may run on background threads - only one at a time
+        self._scan_lock = threading.Lock()
+        # Roots are scanned concurrently and share the queue of unreported samples
+        self._progress_lock = threading.Lock()
+        self._progress = None
+        self._cancelled = None
+        self._unreported = []
+        self._last_report = 0
+
+    def scan_roots(self, root_directories, progress=None, cancelled=None):
         """Scan multiple root directories for samples
 
         Args:
             root_directories: List of directory paths to scan
+            progress: Optional function called on the scanning thread with each
+                batch of newly found samples - the first as soon as it is found,
+                then at most every PROGRESS_INTERVAL seconds; every sample is
+                reported by the time the scan returns
+            cancelled: Optional function checked before each directory is read;
+                once it returns True the scan stops and returns what it has found
 
         Returns:
             list: List of sample info dictionaries
         """
-        all_samples = []
-
-        for root in root_directories:
-            if os.path.exists(root) and os.path.isdir(root):
-                samples = self._scan_directory(root)
-                all_samples.extend(samples)
+        with self._scan_lock:
+            all_samples = []
+
+            # Files not seen again in this scan drop out of the cache
+            self._previous_cache = self._file_cache
+            self._file_cache = {}
+            self._progress = progress
+            self._cancelled = cancelled
+            self._unreported = []
+            self._last_report = 0  # Report the first samples found straight away
+
+            try:
+                roots = [root for root in root_directories
+                         if os.path.exists(root) and os.path.isdir(root)]
+                for samples in self._scan_each_root(roots):
+                    all_samples.extend(samples)
+                self._report_progress(force=True)
+            finally:
+                if self._is_cancelled():
+                    # Keep results for files this scan didn't reach, so the next
+                    # scan still reuses them
+                    for filepath, cached in self._previous_cache.items():
+                        self._file_cache.setdefault(filepath, cached)
+                self._previous_cache = {}
+                self._progress = None
+                self._cancelled = None
+                self._unreported = []
+
+            return all_samples
+
+    def _scan_each_root(self, roots):
+        """Scan root directories concurrently, as directory reads wait on I/O
 
-        return all_samples
+        Returns:
+            list: List of sample lists, one per root in the order given
+        """
+        results = [[] for _ in roots]
+        pending = list(enumerate(roots))  # Taken by the scanning threads
+
+        def worker():
+            while not self._is_cancelled():
+                try:
+                    index, root = pending.pop(0)
+                except IndexError:
+                    return
+                results[index] = self._scan_directory(root)
+
+        # This thread scans too, alongside up to MAX_SCAN_THREADS - 1 helpers
+        threads = [threading.Thread(target=worker)
+                   for _ in range(min(self.MAX_SCAN_THREADS, len(roots)) - 1)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        worker()
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    def invalidate(self, filepath):
+        """Drop the cached result for a file, so the next scan reads it again"""
+        self._file_cache.pop(filepath, None)
+        self._previous_cache.pop(filepath, None)
+
+    def _is_cancelled(self):
+        """Check whether the caller has abandoned the current scan"""
+        return self._cancelled is not None and self._cancelled()
+
+    def _report_progress(self, samples=(), force=False):
+        """Queue newly found samples and pass them to the progress function if due"""
+        if self._progress is None:
+            return
+
+        with self._progress_lock:
+            self._unreported.extend(samples)
+            now = time.time()
+            if self._unreported and (force or now - self._last_report >= self.PROGRESS_INTERVAL):
+                batch = self._unreported
+                self._unreported = []
+                self._last_report = now
+                self._progress(batch)
 
     def _scan_directory(self, directory):
         """Recursively scan a directory for samples with optimization
@@ -48,21 +149,25 @@ class SampleScanner:
         """
         samples = []
 
+        if self._is_cancelled():
+            return samples
+
         try:
             # List all items in directory
             items = os.listdir(directory)
 
             # Check for sample files in this directory
-            sample_files = [f for f in items if f.endswith('.json') and
-                           self._is_sample_file(os.path.join(directory, f))]
-
-            if sample_files:
-                # Found sample files - process them and stop descent
-                for filename in sample_files:
-                    filepath = os.path.join(directory, filename)
-                    sample_info = self._extract_sample_info(filepath)
-                    if sample_info:
-                        samples.append(sample_info)
+            has_samples = False
+            for filename in items:
+                if filename.endswith('.json'):
+                    is_sample, sample_info = self._check_sample_file(os.path.join(directory, filename))
+                    if is_sample:
+                        has_samples = True
+                        if sample_info:
+                            samples.append(sample_info)
+
+            if has_samples:
+                self._report_progress(samples)
                 # Don't descend further - samples found at this level
                 return samples
 
@@ -102,6 +207,34 @@ class SampleScanner:
 
         return samples
 
+    def _check_sample_file(self, filepath):
+        """Check a JSON file and extract its sample information
+
+        Results are cached by file mtime and size, so files unchanged since
+        the previous scan are not parsed again.
+
+        Args:
+            filepath: Path to JSON file
+
+        Returns:
+            tuple: (is_sample, sample_info), where sample_info is None if not
+            a sample or extraction failed
+        """
+        try:
+            stamp = self.sample_io.file_stamp(filepath)
+        except OSError:
+            return False, None
+
+        cached = self._previous_cache.get(filepath)
+        if cached is not None and cached[0] == stamp:
+            result = cached[1]
+        else:
+            is_sample = self._is_sample_file(filepath)
+            result = (is_sample, self._extract_sample_info(filepath) if is_sample else None)
+
+        self._file_cache[filepath] = (stamp, result)
+        return result
+
     def _is_sample_file(self, filepath):
         """Check if file is a valid sample JSON file
 
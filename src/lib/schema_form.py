@@ -10,6 +10,7 @@ from java.awt import *
 import json
 from collections import OrderedDict
 import os
+import re
 import sys
 
 # Import Box for vertical spacing
@@ -22,6 +23,13 @@ if _current_dir not in sys.path:
 
 from text_prompt import TextPrompt
 
+# Parsed schemas shared by all form generators: schema_path -> (mtime, schema)
+# Schemas are treated as read-only once loaded
+_schema_cache = {}
+
+# Flattened schemas: id(schema) -> (schema, {field_path: field_schema}), see compile()
+_compiled_cache = {}
+
 
 class SchemaFormGenerator:
     """Generate Swing form components from JSON Schema"""
@@ -29,20 +37,60 @@ class SchemaFormGenerator:
     def __init__(self, schema_path):
         """Load schema from file"""
         self.schema = self._load_schema(schema_path)
+        self.fields = self.compile(self.schema)  # Field schemas by dotted path
         self.components = {}  # Map field paths to components
         self.text_prompts = {}  # Map field paths to TextPrompt instances
         self.data = {}  # Current form data
         self.app = None  # Reference to app for modification tracking
+        self.form_scroll = None  # Scroll pane from the last create_form_panel call
 
     @staticmethod
     def _load_schema(schema_path):
-        """Load JSON schema file preserving property order"""
+        """
+        Load JSON schema file preserving property order
+
+        Parsed schemas are cached and only re-read when the file's mtime changes
+        """
         try:
+            mtime = os.path.getmtime(schema_path)
+            cached = _schema_cache.get(schema_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
             with open(schema_path, 'r') as f:
-                return json.load(f, object_pairs_hook=OrderedDict)
-        except (IOError, ValueError) as e:
+                schema = json.load(f, object_pairs_hook=OrderedDict)
+            _schema_cache[schema_path] = (mtime, schema)
+            return schema
+        except (IOError, OSError, ValueError) as e:
             raise Exception("Failed to load schema: %s" % str(e))
 
+    @staticmethod
+    def compile(schema):
+        """
+        Flatten schema into a {field_path: field_schema} lookup
+
+        Paths use the same dot notation as form components, descending into
+        nested object properties. The result is cached per parsed schema
+        object, which _load_schema shares between generators.
+        """
+        cached = _compiled_cache.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        fields = {}
+
+        def add_properties(prefix, properties):
+            for name, field_schema in properties.items():
+                field_path = prefix + name
+                fields[field_path] = field_schema
+                if isinstance(field_schema, dict) and field_schema.get('type') == 'object':
+                    add_properties(field_path + '.', field_schema.get('properties', {}))
+
+        add_properties('', schema.get('properties', {}))
+
+        _compiled_cache[id(schema)] = (schema, fields)
+        return fields
+
     def create_form_panel(self, app=None):
         """Create main form panel with all fields"""
         # Clear components dictionary for fresh form
@@ -76,6 +124,7 @@ class SchemaFormGenerator:
         scroll_pane.getVerticalScrollBar().setUnitIncrement(16)
         scroll_pane.getVerticalScrollBar().setBlockIncrement(50)
         scroll_pane.setBorder(None)  # Remove border to avoid visual clutter
+        self.form_scroll = scroll_pane
         return scroll_pane
 
     def _mark_modified(self):
@@ -562,6 +611,24 @@ class SchemaFormGenerator:
                 if value is not None:
                     component.setSelectedItem(value)
 
+    def clear(self):
+        """Reset all form components to their empty state so the form can be reused"""
+        self.data = {}
+
+        for field_path, component in self.components.items():
+            if isinstance(component, dict):
+                # Array field - remove all items
+                self._populate_array_field(component, [])
+            elif isinstance(component, (JTextField, JTextArea)):
+                text_prompt = self.text_prompts.get(field_path)
+                if text_prompt:
+                    text_prompt.hideHint()
+                component.setText("")
+                if text_prompt:
+                    text_prompt.showHint()
+            elif isinstance(component, JComboBox):
+                component.setSelectedIndex(0)
+
     def _populate_array_field(self, array_component, values):
         """Populate array field with existing data"""
         items_container = array_component.get('container')
@@ -716,7 +783,6 @@ class SchemaFormGenerator:
                     # Check if this field is a string array in the schema
                     if self._is_string_array_field(field_path):
                         # Parse comma/semicolon separated values
-                        import re
                         # Split by comma or semicolon, strip whitespace
                         items = re.split(r'[,;]', text)
                         value = [item.strip() for item in items if item.strip()]
@@ -788,23 +854,12 @@ class SchemaFormGenerator:
 
     def _is_string_array_field(self, field_path):
         """Check if a field path represents a string array in the schema"""
-        # Get the schema definition for this field
-        keys = field_path.split('.')
-        schema_obj = self.schema.get('properties', {})
-
-        for key in keys:
-            if key in schema_obj:
-                schema_obj = schema_obj[key]
-                # If this is an object type, move into its properties for the next key
-                if isinstance(schema_obj, dict) and schema_obj.get('type') == 'object':
-                    schema_obj = schema_obj.get('properties', {})
-            else:
-                return False
+        field_schema = self.fields.get(field_path)
 
         # Check if it's an array with string items
-        if isinstance(schema_obj, dict):
-            if schema_obj.get('type') == 'array':
-                items = schema_obj.get('items', {})
+        if isinstance(field_schema, dict):
+            if field_schema.get('type') == 'array':
+                items = field_schema.get('items', {})
                 return items.get('type') == 'string'
 
         return False
@@ -4,12 +4,11 @@ TextPrompt - Hint text for Swing text components
 Shows gray hint text that disappears when user starts typing
 """
 
-from javax.swing.event import DocumentListener
 from java.awt import Color
 from java.awt.event import FocusListener, KeyAdapter
 
 
-class TextPrompt(DocumentListener, FocusListener):
+class TextPrompt(FocusListener):
     """Display hint text in a text component when empty"""
 
     def __init__(self, text, component):
@@ -29,11 +28,9 @@ class TextPrompt(DocumentListener, FocusListener):
         self.hint_color = Color(160, 160, 160)
         self.normal_color = component.getForeground()
 
-        # Add listeners
+        # Hint is hidden on focus or first keystroke and shown again on focus
+        # loss; programmatic setText callers hide it explicitly
         component.addFocusListener(self)
-        component.getDocument().addDocumentListener(self)
-
-        # Add key listener to catch first keystroke
         component.addKeyListener(KeyHandler(self))
 
         # Show hint if empty
@@ -66,44 +63,6 @@ class TextPrompt(DocumentListener, FocusListener):
             return ""
         return self.component.getText()
 
-    # DocumentListener methods
-    def insertUpdate(self, e):
-        # Ignore events while we're updating
-        if self.updating:
-            return
-        # If showing hint and text was inserted, it means user is typing
-        if self.showing_hint:
-            # Check if the text is different from hint (user typed something)
-            from javax.swing import SwingUtilities
-            SwingUtilities.invokeLater(lambda: self._checkAndHide())
-
-    def removeUpdate(self, e):
-        # Ignore events while we're updating
-        if self.updating:
-            return
-        # If text was removed and field is now empty, show hint
-        from javax.swing import SwingUtilities
-        SwingUtilities.invokeLater(lambda: self._checkAndShow())
-
-    def changedUpdate(self, e):
-        pass
-
-    def _checkAndHide(self):
-        """Check if we should hide the hint"""
-        if self.updating:
-            return
-        text = self.component.getText()
-        if self.showing_hint and text != self.hint_text:
-            self.hideHint()
-
-    def _checkAndShow(self):
-        """Check if we should show the hint"""
-        if self.updating:
-            return
-        text = self.component.getText()
-        if not self.showing_hint and len(text) == 0:
-            self.showHint()
-
     # FocusListener methods
     def focusGained(self, e):
         if self.showing_hint:
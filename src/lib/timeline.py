@@ -4,13 +4,90 @@ Timeline Module
 Handles timeline view showing samples and experiments chronologically
 """
 
+import operator
 import os
+import stat
+import threading
 from datetime import datetime
 
+# Number of worker threads used to read sample and acqus files
+_MAX_WORKERS = 8
 
-class TimelineEntry:
+# Entry display time, equivalent to strftime("%Y-%m-%d %H:%M:%S") on
+# (year, month, day, hour, minute, second) but without strftime's overhead
+_DISPLAY_TIME_FORMAT = "%04d-%02d-%02d %02d:%02d:%02d"
+
+# Bound on the number of parsed timestamps kept in each cache below
+_TIMESTAMP_CACHE_SIZE = 1024
+
+# Parsed timestamps shared across timeline builds (datetime objects are immutable)
+_unix_timestamp_cache = {}
+_iso_timestamp_cache = {}
+
+
+def _utc_from_unix(timestamp):
+    """Convert Unix timestamp to naive UTC datetime, reusing previous conversions"""
+    dt = _unix_timestamp_cache.get(timestamp)
+    if dt is None:
+        if len(_unix_timestamp_cache) >= _TIMESTAMP_CACHE_SIZE:
+            _unix_timestamp_cache.clear()
+        dt = _unix_timestamp_cache[timestamp] = datetime.utcfromtimestamp(timestamp)
+    return dt
+
+
+# acqus parameters read for the timeline: JCAMP key -> (info key, converter)
+_ACQUS_KEYS = {
+    '##$DATE': ('date', lambda v: _utc_from_unix(int(v))),  # Unix timestamp
+    '##$PULPROG': ('pulprog', lambda v: v.strip('<>')),
+    '##$NUC1': ('nucleus', lambda v: v.strip('<>')),
+    '##$NS': ('ns', str),  # Number of scans
+    '##$HOLDER': ('holder', int),  # Sample holder position
+    '##$PARMODE': ('parmod', int),  # PARMOD (dimensions - 1)
+}
+
+# TopSpin writes acqus parameters in sorted order, so nothing of interest
+# follows this key
+_ACQUS_LAST_KEY = max(_ACQUS_KEYS)
+
+
+def _map_threaded(func, items, max_workers=_MAX_WORKERS):
+    """
+    Apply func to each item using a small pool of worker threads
+
+    Timeline building is dominated by file I/O, which may be slow on network
+    storage, so overlapping reads across threads cuts the wall-clock time.
+    func must handle its own exceptions.
+
+    Returns list of results in the same order as items
+    """
+    items = list(items)
+    n_workers = min(max_workers, len(items))
+    if n_workers <= 1:
+        return [func(item) for item in items]
+
+    results = [None] * len(items)
+
+    def worker(offset):
+        for i in range(offset, len(items), n_workers):
+            results[i] = func(items[i])
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(n_workers)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    for t in threads:
+        t.join()
+
+    return results
+
+
+class TimelineEntry(object):
     """Represents an entry in the timeline (sample or experiment)"""
 
+    # Timelines can hold many entries, so avoid a per-instance __dict__
+    __slots__ = ('entry_type', 'timestamp', 'name', 'details', 'holder', 'parmod',
+                 'filepath', '_display', '_time_str')
+
     def __init__(self, entry_type, timestamp, name, details='', holder=None, parmod=None):
         """
         Args:
@@ -28,6 +105,11 @@ class TimelineEntry:
         self.holder = holder  # Sample holder position
         self.parmod = parmod  # PARMOD value (dimensions = parmod + 1)
         self.filepath = None  # For experiments: full path to expno directory
+        self._display = None  # Cached display text (entries are not modified after creation)
+        # Format timestamp once at construction
+        self._time_str = _DISPLAY_TIME_FORMAT % (
+            timestamp.year, timestamp.month, timestamp.day,
+            timestamp.hour, timestamp.minute, timestamp.second)
 
     def get_sort_key(self):
         """Get sorting key for chronological ordering"""
@@ -35,16 +117,19 @@ class TimelineEntry:
 
     def get_display_text(self):
         """Get formatted text for display"""
-        time_str = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        if self._display is None:
+            time_str = self._time_str
+
+            if self.entry_type == 'sample_created':
+                self._display = "%s | Sample Created | %s" % (time_str, self.name)
+            elif self.entry_type == 'sample_ejected':
+                self._display = "%s | Sample Ejected | %s" % (time_str, self.name)
+            elif self.entry_type == 'experiment':
+                self._display = "%s | Experiment %s | %s" % (time_str, self.name, self.details)
+            else:
+                self._display = "%s | %s" % (time_str, self.name)
 
-        if self.entry_type == 'sample_created':
-            return "%s | Sample Created | %s" % (time_str, self.name)
-        elif self.entry_type == 'sample_ejected':
-            return "%s | Sample Ejected | %s" % (time_str, self.name)
-        elif self.entry_type == 'experiment':
-            return "%s | Experiment %s | %s" % (time_str, self.name, self.details)
-        else:
-            return "%s | %s" % (time_str, self.name)
+        return self._display
 
     def __str__(self):
         """String representation for display in JList"""
@@ -64,6 +149,11 @@ class TimelineBuilder:
             sample_io: SampleIO instance for reading sample files
         """
         self.sample_io = sample_io
+        # Parsed sample entries by filepath: filepath -> (stamp, [TimelineEntry, ...]),
+        # where stamp is SampleIO.file_stamp (mtime, size)
+        self._sample_cache = {}
+        # Experiment entries by acqus path: acqus_path -> ((mtime, size), TimelineEntry)
+        self._expt_cache = {}
 
     def build_timeline(self, directory):
         """
@@ -80,56 +170,100 @@ class TimelineBuilder:
         entries.extend(self._get_experiment_entries(directory))
 
         # Sort chronologically
-        entries.sort(key=lambda e: e.get_sort_key())
+        entries.sort(key=operator.attrgetter('timestamp'))
 
         return entries
 
+    @staticmethod
+    def index_experiment_samples(entries):
+        """
+        Find the sample that was active during each experiment in a timeline
+
+        Makes a single pass over entries, tracking the active sample: a
+        sample_created entry makes that sample active and a sample_ejected
+        entry leaves none active.
+
+        Returns dict of expno (int) -> active sample filepath (None if no
+        sample was active), for the first entry of each experiment
+        """
+        active_samples = {}
+        current_sample_filepath = None
+        for entry in entries:
+            if entry.entry_type == 'sample_created':
+                current_sample_filepath = entry.filepath
+            elif entry.entry_type == 'sample_ejected':
+                current_sample_filepath = None
+            elif entry.entry_type == 'experiment' and entry.name.isdigit():
+                active_samples.setdefault(int(entry.name), current_sample_filepath)
+        return active_samples
+
     def _get_sample_entries(self, directory):
         """Get timeline entries from sample JSON files"""
         entries = []
 
-        sample_files = self.sample_io.list_sample_files(directory)
+        sample_paths = self.sample_io.list_sample_paths(directory)
+        self._evict_missing_samples(directory, sample_paths)
 
-        for filename in sample_files:
-            filepath = os.path.join(directory, filename)
+        for file_entries in _map_threaded(
+                lambda sample_path: self._get_sample_file_entries(*sample_path),
+                sample_paths):
+            entries.extend(file_entries)
 
-            try:
-                data = self.sample_io.read_sample(filepath)
-                metadata = data.get('metadata', {})
-
-                # Get sample label
-                sample_label = data.get('sample', {}).get('label', 'Unknown')
-                if not sample_label:
-                    # Fall back to filename
-                    _, label = self.sample_io.parse_filename(filename)
-                    sample_label = label if label else 'Unknown'
+        return entries
 
-                # Created entry
-                created_ts = metadata.get('created_timestamp')
-                if created_ts:
-                    try:
-                        dt = self._parse_iso_timestamp(created_ts)
-                        entry = TimelineEntry('sample_created', dt, sample_label)
-                        entry.filepath = filepath
-                        entries.append(entry)
-                    except ValueError:
-                        pass
+    def _get_sample_file_entries(self, filename, filepath):
+        """
+        Get created/ejected timeline entries for a single sample file
 
-                # Ejected entry (if exists)
-                ejected_ts = metadata.get('ejected_timestamp')
-                if ejected_ts:
-                    try:
-                        dt = self._parse_iso_timestamp(ejected_ts)
-                        entry = TimelineEntry('sample_ejected', dt, sample_label)
-                        entry.filepath = filepath
-                        entries.append(entry)
-                    except ValueError:
-                        pass
+        Entries are cached by file mtime and size, as SampleIO caches parsed
+        samples, so unchanged files are not re-read when the timeline is
+        rebuilt and writes within one mtime tick are still picked up.
+        """
+        entries = []
 
-            except Exception as e:
-                # Skip files that can't be read
-                print("Warning: Could not read sample file %s: %s" % (filename, str(e)))
-                continue
+        try:
+            stamp = self.sample_io.file_stamp(filepath)
+            cached = self._sample_cache.get(filepath)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            # Only the summary fields are needed, so skip copying the whole document
+            summary = self.sample_io.read_summary(filepath)
+
+            # Get sample label
+            sample_label = summary['label']
+            if not sample_label:
+                # Fall back to filename
+                _, label = self.sample_io.parse_filename(filename)
+                sample_label = label if label else 'Unknown'
+
+            # Created entry
+            created_ts = summary['created']
+            if created_ts:
+                try:
+                    dt = self._parse_iso_timestamp(created_ts)
+                    entry = TimelineEntry('sample_created', dt, sample_label)
+                    entry.filepath = filepath
+                    entries.append(entry)
+                except ValueError:
+                    pass
+
+            # Ejected entry (if exists)
+            ejected_ts = summary['ejected']
+            if ejected_ts:
+                try:
+                    dt = self._parse_iso_timestamp(ejected_ts)
+                    entry = TimelineEntry('sample_ejected', dt, sample_label)
+                    entry.filepath = filepath
+                    entries.append(entry)
+                except ValueError:
+                    pass
+
+            self._sample_cache[filepath] = (stamp, entries)
+
+        except Exception as e:
+            # Skip files that can't be read
+            print("Warning: Could not read sample file %s: %s" % (filename, str(e)))
 
         return entries
 
@@ -145,139 +279,204 @@ class TimelineBuilder:
             return entries
 
         try:
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
+            expno_dirs = self._list_expno_dirs(directory)
+        except OSError as e:
+            print("Warning: Could not list directory %s: %s" % (directory, str(e)))
+            return entries
+
+        self._evict_missing_experiments(directory, expno_dirs)
+
+        for entry in _map_threaded(self._get_experiment_entry, expno_dirs):
+            if entry is not None:
+                entries.append(entry)
 
-                # Check if it's a directory with integer name
-                if os.path.isdir(item_path) and item.isdigit():
-                    expno = int(item)
+        return entries
 
-                    # Check for acqu file (indicates valid experiment directory)
-                    acqu_path = os.path.join(item_path, 'acqu')
-                    acqus_path = os.path.join(item_path, 'acqus')
+    def _get_experiment_entry(self, expno_dir):
+        """
+        Get timeline entry for a single experiment directory
 
-                    if os.path.isfile(acqu_path):
-                        # Check if experiment has been acquired (has acqus file)
-                        if os.path.isfile(acqus_path):
-                            # Acquired experiment - get timestamp from acqus file
-                            try:
-                                dt = self._get_experiment_timestamp(acqus_path)
+        Args:
+            expno_dir: (name, path) tuple from _list_expno_dirs
 
-                                # If we couldn't extract timestamp from file, fall back to mtime
-                                if dt is None:
-                                    mtime = os.path.getmtime(acqus_path)
-                                    # Convert to naive UTC datetime for consistency with other timestamps
-                                    dt = datetime.utcfromtimestamp(mtime)
+        Returns TimelineEntry, or None if the experiment has not been acquired
+        """
+        item, item_path = expno_dir
+        expno = int(item)
 
-                                # Try to get experiment details, holder, and parmod from acqus
-                                exp_details, holder, parmod = self._parse_acqus_info(acqus_path)
+        acqus_path = os.path.join(item_path, 'acqus')
 
-                                entry = TimelineEntry('experiment', dt, str(expno), exp_details, holder, parmod)
-                                entry.filepath = item_path
-                                entries.append(entry)
+        # Acquired experiment - get timestamp from acqus file
+        try:
+            stamp = self._get_acqus_stamp(item_path)
+            if stamp is None:
+                # Experiment not yet acquired (no acqus file) - skip for timeline
+                return None
+
+            # Reuse previous entry if acqus is unchanged, skipping all file reads
+            cached = self._expt_cache.get(acqus_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            # Read timestamp, details, holder and parmod from acqus in one pass
+            info = self._parse_acqus_file(acqus_path)
+
+            # If we couldn't extract timestamp from file, fall back to mtime
+            dt = info.get('date')
+            if dt is None:
+                # Convert to naive UTC datetime for consistency with other timestamps
+                dt = _utc_from_unix(stamp[0])
+
+            exp_details = self._get_acqus_summary(info)
+
+            entry = TimelineEntry('experiment', dt, str(expno), exp_details,
+                                  info.get('holder'), info.get('parmod'))
+            entry.filepath = item_path
+            self._expt_cache[acqus_path] = (stamp, entry)
+            return entry
+
+        except (OSError, ValueError) as e:
+            print("Warning: Could not process experiment %s: %s" % (item, str(e)))
+            return None
 
-                            except (OSError, ValueError) as e:
-                                print("Warning: Could not process experiment %s: %s" % (item, str(e)))
-                                continue
-                        # else: experiment not yet acquired (no acqus file) - skip for timeline
+    def _evict_missing_samples(self, directory, sample_paths):
+        """Drop cached entries for sample files no longer present in directory"""
+        present = set(filepath for _, filepath in sample_paths)
+        self._evict_stale(self._sample_cache, set(self._sample_cache) - present, directory, 1)
 
-        except OSError as e:
-            print("Warning: Could not list directory %s: %s" % (directory, str(e)))
+    def _evict_missing_experiments(self, directory, expno_dirs):
+        """Drop cached acqus details for experiments no longer present in directory"""
+        present = set(os.path.join(item_path, 'acqus') for _, item_path in expno_dirs)
+        self._evict_stale(self._expt_cache, set(self._expt_cache) - present, directory, 2)
 
-        return entries
+    @staticmethod
+    def _evict_stale(cache, missing, directory, depth):
+        """
+        Remove cache keys that are missing from directory
+
+        Args:
+            cache: Cache dict keyed by file path
+            missing: Set of cached paths not found in the latest listing
+            directory: Directory that was listed
+            depth: Number of path components between directory and cached path
+        """
+        directory = os.path.normpath(directory)
+        for path in missing:
+            parent = path
+            for _ in range(depth):
+                parent = os.path.dirname(parent)
+            # Cached paths from other directories remain valid
+            if os.path.normpath(parent) == directory:
+                del cache[path]
 
     @staticmethod
-    def _get_experiment_timestamp(acqus_path):
+    def _get_acqus_stamp(item_path):
         """
-        Extract experiment timestamp from acqus file.
+        Get (mtime, size) of the acqus file in an experiment directory
 
-        Reads ##$DATE= Unix timestamp (e.g. ##$DATE= 1483480402).
-        Falls back to file mtime if not found.
+        The acqus file is stat'ed once, giving its type, mtime and size.
 
-        Returns datetime object (UTC) or None if not found
+        Returns (mtime, size), or None if the directory lacks an acqu file
+        (not an experiment) or acqus file (not yet acquired)
         """
+        if not os.path.isfile(os.path.join(item_path, 'acqu')):
+            return None
         try:
-            with open(acqus_path, 'r') as f:
-                for line in f:
-                    if line.startswith('##$DATE='):
-                        value = line.split('=')[1].strip()
-                        unix_ts = int(value)
-                        return datetime.utcfromtimestamp(unix_ts)
-
+            st = os.stat(os.path.join(item_path, 'acqus'))
+        except OSError:
             return None
-
-        except Exception:
+        if not stat.S_ISREG(st.st_mode):
             return None
+        return (st.st_mtime, st.st_size)
+
+    @staticmethod
+    def _list_expno_dirs(directory):
+        """
+        List integer-named subdirectories of directory
+
+        Only entries whose names are digits are stat'ed, so sample files and
+        other non-experiment entries cost nothing beyond the listing.
+
+        Returns list of (name, path) tuples
+        """
+        expno_dirs = []
+        for item in os.listdir(directory):
+            if item.isdigit():
+                item_path = os.path.join(directory, item)
+                if os.path.isdir(item_path):
+                    expno_dirs.append((item, item_path))
+        return expno_dirs
 
     @staticmethod
     def _parse_iso_timestamp(timestamp_str):
         """Parse ISO 8601 timestamp string to datetime object"""
-        # Handle format: 2023-10-09T11:10:00.000Z
-        # Remove 'Z' suffix and milliseconds for simplicity
-        ts = timestamp_str.replace('Z', '').split('.')[0]
-        return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S")
+        dt = _iso_timestamp_cache.get(timestamp_str)
+        if dt is None:
+            # Handle format: 2023-10-09T11:10:00.000Z
+            # Remove 'Z' suffix and milliseconds for simplicity
+            ts = timestamp_str.replace('Z', '').split('.')[0]
+            dt = datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S")
+            if len(_iso_timestamp_cache) >= _TIMESTAMP_CACHE_SIZE:
+                _iso_timestamp_cache.clear()
+            _iso_timestamp_cache[timestamp_str] = dt
+        return dt
 
     @staticmethod
-    def _parse_acqus_info(acqus_path):
-        """
-        Parse acqus file to extract useful information
-        Returns (summary_string, holder_position, parmod)
+    def _parse_acqus_file(acqus_path):
         """
-        try:
-            with open(acqus_path, 'r') as f:
-                lines = f.readlines()
-
-            info = {}
-
-            # Look for key parameters
-            for line in lines:
-                line = line.strip()
-
-                # PULPROG
-                if line.startswith('##$PULPROG='):
-                    value = line.split('=')[1].strip()
-                    info['pulprog'] = value.strip('<>')
+        Parse acqus file in a single pass to extract timestamp and experiment details
 
-                # NUCLEUS (NUC1)
-                elif line.startswith('##$NUC1='):
-                    value = line.split('=')[1].strip()
-                    info['nucleus'] = value.strip('<>')
+        Reads ##$DATE= Unix timestamp (e.g. ##$DATE= 1483480402) along with
+        PULPROG, NUC1, NS, HOLDER and PARMODE. Stops reading once all
+        parameters of interest have been found, or once past the last of them
+        in the sorted parameter list, so the large arrays at the end of the
+        file are never scanned.
 
-                # Number of scans
-                elif line.startswith('##$NS='):
-                    value = line.split('=')[1].strip()
-                    info['ns'] = value
+        Returns dict with any of 'date' (datetime, UTC), 'pulprog', 'nucleus',
+        'ns', 'holder' and 'parmod' that could be read
+        """
+        info = {}
 
-                # Holder position
-                elif line.startswith('##$HOLDER='):
-                    value = line.split('=')[1].strip()
-                    try:
-                        info['holder'] = int(value)
-                    except ValueError:
-                        pass
+        try:
+            remaining = len(_ACQUS_KEYS)
 
-                # PARMOD (dimensions - 1)
-                elif line.startswith('##$PARMODE='):
-                    value = line.split('=')[1].strip()
+            with open(acqus_path, 'r') as f:
+                for line in f:
+                    # All parameters of interest share the ##$ prefix
+                    if not line.startswith('##$'):
+                        continue
+
+                    key, _, value = line.partition('=')
+                    target = _ACQUS_KEYS.get(key)
+                    if target is None:
+                        if key > _ACQUS_LAST_KEY:
+                            break
+                        continue
+
+                    name, convert = target
                     try:
-                        info['parmod'] = int(value)
+                        info[name] = convert(value.strip())
                     except ValueError:
                         pass
 
-            # Build summary
-            parts = []
-            if 'pulprog' in info:
-                parts.append(info['pulprog'])
-            if 'nucleus' in info:
-                parts.append(info['nucleus'])
-            if 'ns' in info:
-                parts.append("%s scans" % info['ns'])
+                    remaining -= 1
+                    if remaining == 0:
+                        break
 
-            summary = ", ".join(parts) if parts else "NMR experiment"
-            holder = info.get('holder', None)
-            parmod = info.get('parmod', None)
+        except Exception:
+            pass
 
-            return summary, holder, parmod
+        return info
 
-        except Exception:
-            return "NMR experiment", None, None
+    @staticmethod
+    def _get_acqus_summary(info):
+        """Build experiment summary string from parsed acqus info"""
+        parts = []
+        if 'pulprog' in info:
+            parts.append(info['pulprog'])
+        if 'nucleus' in info:
+            parts.append(info['nucleus'])
+        if 'ns' in info:
+            parts.append("%s scans" % info['ns'])
+
+        return ", ".join(parts) if parts else "NMR experiment"
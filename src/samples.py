@@ -8,13 +8,15 @@ from javax.swing import *
 from javax.swing.event import DocumentListener
 from javax.swing.table import DefaultTableModel, AbstractTableModel, DefaultTableCellRenderer
 from java.awt import *
-from java.awt.event import MouseAdapter, KeyEvent
-from javax.swing import AbstractAction, KeyStroke, JComponent, DefaultListModel
-from java.lang import System
+from java.awt.event import MouseAdapter, KeyEvent, ActionListener
+from javax.swing import AbstractAction, KeyStroke, JComponent, DefaultListModel, Timer
+from java.lang import System, String
 import java.awt.event
 import sys
 import os
+import calendar
 import json
+import time
 from datetime import datetime, timedelta
 
 # Add lib directory to path - use script directory fallback since __file__ may not be defined in Jython
@@ -25,6 +27,8 @@ except NameError:
     script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
 
 lib_path = os.path.join(script_dir, 'lib')
+CURRENT_SCHEMA_PATH = os.path.join(script_dir, 'schemas', 'current', 'schema.json')
+SCHEMA_VERSIONS_DIR = os.path.join(script_dir, 'schemas', 'versions')
 if lib_path not in sys.path:
     sys.path.insert(0, lib_path)
 
@@ -37,6 +41,110 @@ from html_view import HTMLViewGenerator
 
 APP_KEY = "org.nmr-samples.topspin"
 
+# Seconds for which a CURDATA lookup is reused before asking TopSpin again
+CURDATA_MAX_AGE = 5
+
+# Milliseconds within which directory changes are coalesced into one refresh
+DIRECTORY_CHANGE_DELAY_MS = 20
+
+# Milliseconds within which timeline refreshes after edits are coalesced
+TIMELINE_REFRESH_DELAY_MS = 50
+
+# Milliseconds of editing pause before the draft badge picks up the new label
+DRAFT_BADGE_DELAY_MS = 300
+
+
+def _badge_style(background, outline):
+    """Badge background colour and rounded border, built once and shared"""
+    return (background, BorderFactory.createCompoundBorder(
+        BorderFactory.createLineBorder(outline, 2, True),
+        BorderFactory.createEmptyBorder(8, 15, 8, 15)
+    ))
+
+# Shared colours and borders - Swing colours and borders are immutable, so
+# one instance can be used by every component (and every badge update)
+PRIMARY_BUTTON_COLOR = Color(200, 230, 200)  # Green
+DETAIL_TEXT_COLOR = Color(100, 100, 100)
+TABLE_GRID_COLOR = Color(230, 230, 230)
+BADGE_STYLES = {
+    'draft': _badge_style(Color(218, 165, 32), Color(184, 134, 11)),  # Amber/gold
+    'active': _badge_style(Color(34, 139, 34), Color(0, 100, 0)),  # Forest green
+    'empty': _badge_style(Color(180, 180, 180), Color(140, 140, 140)),  # Grey
+}
+
+# Day and month abbreviations for timeline timestamps (avoids strftime per row)
+DAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Timeline entry types that mark a sample being created or ejected
+SAMPLE_EVENT_TYPES = frozenset(('sample_created', 'sample_ejected'))
+
+
+# Bound on the number of formatted timestamps kept in _timeline_time_cache
+_TIMELINE_TIME_CACHE_SIZE = 4096
+
+# Timeline display strings by UTC datetime, reused across timeline refreshes
+_timeline_time_cache = {}
+
+
+def _format_timeline_time(timestamp):
+    """Format a UTC datetime as local time for the timeline, e.g. 'Mon 3 Jun 2024, 2.05 PM'"""
+    timestamp_str = _timeline_time_cache.get(timestamp)
+    if timestamp_str is not None:
+        return timestamp_str
+
+    # Convert datetime to timestamp, then to local time
+    utc_timestamp = calendar.timegm(timestamp.timetuple())
+    local_dt = datetime.fromtimestamp(utc_timestamp)
+
+    # Format timestamp for display - capitalize, no zero padding
+    # Manual formatting for cross-platform compatibility
+    day_name = DAY_NAMES[local_dt.weekday()]  # Mon, Tue, etc.
+    day = local_dt.day  # 1-31, no zero padding
+    month = MONTH_NAMES[local_dt.month - 1]  # Jan, Feb, etc.
+    year = local_dt.year
+    hour = local_dt.hour
+    minute = local_dt.minute
+
+    # Convert to 12-hour format (0 -> 12 AM, 12 -> 12 PM)
+    hour_12 = (hour + 11) % 12 + 1
+    am_pm = "PM" if hour >= 12 else "AM"
+
+    timestamp_str = "%s %d %s %d, %d.%02d %s" % (day_name, day, month, year, hour_12, minute, am_pm)
+
+    if len(_timeline_time_cache) >= _TIMELINE_TIME_CACHE_SIZE:
+        _timeline_time_cache.clear()
+    _timeline_time_cache[timestamp] = timestamp_str
+    return timestamp_str
+
+
+# Badge load times by created timestamp string, bounded like _timeline_time_cache
+_badge_time_cache = {}
+
+
+def _format_badge_time(created):
+    """
+    Format a sample's UTC created timestamp as local time for the badge, e.g. '2:05 PM'
+
+    Returns None if the timestamp can't be parsed
+    """
+    if created in _badge_time_cache:
+        return _badge_time_cache[created]
+
+    try:
+        # Parse UTC timestamp and convert to local time
+        dt_utc = datetime.strptime(created[:19], "%Y-%m-%dT%H:%M:%S")
+        utc_timestamp = calendar.timegm(dt_utc.timetuple())
+        time_str = datetime.fromtimestamp(utc_timestamp).strftime("%I:%M %p").lstrip('0')
+    except (ValueError, TypeError, OverflowError):
+        time_str = None
+
+    if len(_badge_time_cache) >= _TIMELINE_TIME_CACHE_SIZE:
+        _badge_time_cache.clear()
+    _badge_time_cache[created] = time_str
+    return time_str
+
 
 class SampleManagerApp:
     """Main sample manager application using singleton pattern"""
@@ -46,17 +154,33 @@ class SampleManagerApp:
         self.current_directory = None
         self.sample_io = SampleIO()
 
-        # Get script directory for schema path
-        try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-        except NameError:
-            script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-
+        # Script directory is resolved once at module load
         self.script_dir = script_dir
-        self.current_schema_path = os.path.join(script_dir, 'schemas', 'current', 'schema.json')
+        self.current_schema_path = CURRENT_SCHEMA_PATH
         self.form_generator = None
         self.current_sample_file = None
-        self.timeline_builder = TimelineBuilder(self.sample_io)
+        # Sample lists and timelines are also read on the TopSpin command thread
+        # (see _store_curdata) and background refresh threads, so _timeline_cache,
+        # the TimelineBuilder caches and the SampleIO caches are shared between
+        # threads. Jython dicts are thread-safe for single operations, and each
+        # cache only ever gets or replaces whole (stamp, value) entries that are
+        # not modified once stored, so a race at worst reads a file twice. The builder is created
+        # here rather than on first use so threads never race to create it.
+        self._timeline_builder = TimelineBuilder(self.sample_io)
+        self._timeline_cache = {}  # directory -> (signature, entries), see _build_timeline
+        self._schema_path_cache = {}  # version -> schema path or None, see _get_schema_path_for_version
+        self._experiment_samples = None  # (entries, samples) for the last timeline indexed
+        self._last_ejected_label = None  # For the badge, see _apply_sample_rows
+        self._active_sample_row = None  # (directory, mtime, row or None), see _get_active_sample
+        self._sample_list_generation = 0  # Incremented per sample list refresh
+        self._catalogue_generation = 0  # Incremented per catalogue refresh
+        self._last_curdata = None  # (time, path, expno) from the last CURDATA lookup
+        self._directory_timer = None  # Coalesces directory changes, see _set_directory_later
+        self._pending_directory = None  # (directory, expno, sample_rows) for _directory_timer
+        self._draft_badge_timer = None  # Debounces draft badge updates, see mark_form_modified
+        self._timeline_timer = None  # Coalesces timeline refreshes, see _refresh_timeline_later
+        self._timeline_rows_entries = None  # Timeline entries the timeline rows were built from
+        self._action_dispatcher = AppActionDispatcher(self)  # Shared by buttons, see _bind_action
         self.form_modified = False  # Track if form has been edited
         self.is_draft = False  # Track if current form is an unsaved draft
         self.draft_data = None  # Store draft data for unsaved samples
@@ -83,6 +207,8 @@ class SampleManagerApp:
         self.btn_save = None
         self.btn_cancel = None
         self.form_panel = None
+        self.form_content = None
+        self.directory_chooser = None  # Created on first Browse, see _browse_directory
         self.timeline_table = None
         self.timeline_table_model = None
         self.create_from_selection_btn = None
@@ -102,10 +228,15 @@ class SampleManagerApp:
         self.catalogue_btn_duplicate = None
         self.catalogue_center_panel = None  # CardLayout panel for table/empty state
 
-        # Initialize
+    def build_gui(self):
+        """Build the window and navigate to the current dataset, if not already built"""
+        if self.frame is not None:
+            return
+
         self._create_gui()
         self._set_initial_button_states()
-        self._navigate_to_curdata()
+        # Window is already showing - read the dataset without blocking the EDT
+        self._navigate_to_curdata(background=True)
         # Check for updates in background
         self._check_updates_background()
 
@@ -128,25 +259,101 @@ class SampleManagerApp:
         self.form_modified = True
         self.btn_save.setEnabled(True)
         self.btn_cancel.setEnabled(True)
-        # Update draft data for badge display
+        # Update draft data for badge display once editing pauses - reading the
+        # whole form on every keystroke is wasted work while the user is typing
+        if self.is_draft and self.form_generator:
+            if self._draft_badge_timer is None:
+                self._draft_badge_timer = Timer(DRAFT_BADGE_DELAY_MS,
+                                                lambda e: self._update_draft_badge())
+                self._draft_badge_timer.setRepeats(False)
+            self._draft_badge_timer.restart()
+
+    def _update_draft_badge(self):
+        """Refresh draft data and badge after form edits (runs on the EDT)"""
         if self.is_draft and self.form_generator:
             self.draft_data = self.form_generator.get_data()
             self._update_badge()
 
     def _get_git_version(self):
         """Get git commit hash for version display"""
-        try:
-            import subprocess
-            # Get short commit hash
-            result = subprocess.check_output(
-                ['git', 'rev-parse', '--short', 'HEAD'],
-                cwd=self.script_dir,
-                stderr=subprocess.STDOUT
-            )
-            return result.strip()
-        except:
+        # Read the checkout's HEAD directly - starting a git process is slow under Jython
+        commit = self._read_git_head(self.script_dir)
+        if commit:
+            return commit[:7]
+        return None
+
+    @staticmethod
+    def _find_git_dir(directory):
+        """
+        Find the git directory for a checkout containing directory
+
+        Follows the "gitdir: <path>" file used by worktrees and submodules.
+        Returns None if directory is not inside a git checkout.
+        """
+        while True:
+            candidate = os.path.join(directory, '.git')
+            if os.path.isdir(candidate):
+                return candidate
+            if os.path.isfile(candidate):
+                try:
+                    with open(candidate, 'r') as f:
+                        content = f.read().strip()
+                except (IOError, OSError):
+                    return None
+                if not content.startswith('gitdir: '):
+                    return None
+                return os.path.normpath(os.path.join(directory, content[8:]))
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None
+            directory = parent
+
+    @staticmethod
+    def _read_git_head(directory):
+        """
+        Read the commit hash of HEAD from the git directory for directory
+
+        Returns None if there is no git directory or HEAD can't be resolved
+        """
+        git_dir = SampleManagerApp._find_git_dir(directory)
+        if git_dir is None:
             return None
 
+        try:
+            with open(os.path.join(git_dir, 'HEAD'), 'r') as f:
+                head = f.read().strip()
+            if not head.startswith('ref: '):
+                return head  # Detached HEAD
+
+            # Worktrees keep their branch refs in the main repository's git directory
+            ref_dirs = [git_dir]
+            commondir_path = os.path.join(git_dir, 'commondir')
+            if os.path.isfile(commondir_path):
+                with open(commondir_path, 'r') as f:
+                    ref_dirs.append(os.path.normpath(os.path.join(git_dir, f.read().strip())))
+
+            ref = head[5:]
+            for ref_dir in ref_dirs:
+                ref_path = os.path.join(ref_dir, *ref.split('/'))
+                if os.path.isfile(ref_path):
+                    with open(ref_path, 'r') as f:
+                        return f.read().strip()
+
+            # Ref may only be in packed-refs, as "<hash> <ref>" lines
+            for ref_dir in ref_dirs:
+                packed_refs_path = os.path.join(ref_dir, 'packed-refs')
+                if not os.path.isfile(packed_refs_path):
+                    continue
+                with open(packed_refs_path, 'r') as f:
+                    for line in f:
+                        parts = line.split()
+                        if len(parts) == 2 and parts[1] == ref:
+                            return parts[0]
+        except (IOError, OSError):
+            pass
+
+        return None
+
     def _check_for_updates(self):
         """Check if git updates are available
 
@@ -223,6 +430,72 @@ class SampleManagerApp:
             self.update_status("Ready")
             return (None, None, debug_msg)
 
+    def _build_timeline(self, directory):
+        """Build timeline for directory, reusing the previous build if nothing has changed"""
+        signature = self._get_timeline_signature(directory)
+        cached = self._timeline_cache.get(directory)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return cached[1]
+
+        entries = self._timeline_builder.build_timeline(directory)
+        self._timeline_cache[directory] = (signature, entries)
+        return entries
+
+    def _get_experiment_samples(self, directory):
+        """
+        Get the timeline for directory with the active sample for each experiment
+
+        Returns (entries, samples) - see TimelineBuilder.index_experiment_samples.
+        The samples are kept until the timeline is rebuilt.
+        """
+        entries = self._build_timeline(directory)
+        cached = self._experiment_samples
+        if cached is None or cached[0] is not entries:
+            cached = self._experiment_samples = (
+                entries, TimelineBuilder.index_experiment_samples(entries))
+        return cached
+
+    @staticmethod
+    def _get_timeline_signature(directory):
+        """
+        Get a signature of the files a directory's timeline is built from
+
+        Combines the mtime of the directory with the mtime and size (see
+        SampleIO.file_stamp) of each sample file and each experiment's acqus
+        file (None for experiments not yet acquired), so writes within one
+        mtime tick still change it. Returns None if the directory can't be listed.
+
+        This costs a listing plus one stat per sample and experiment on every
+        refresh. When the signature has changed, TimelineBuilder lists and
+        stats the same files again for its per-file caches, so a rebuild
+        costs about 2N stats - still far cheaper than re-reading the files.
+        """
+        try:
+            signature = [os.path.getmtime(directory)]
+            for name in sorted(os.listdir(directory)):
+                if name.isdigit():
+                    try:
+                        stamp = SampleIO.file_stamp(os.path.join(directory, name, 'acqus'))
+                    except OSError:
+                        stamp = None
+                elif name.endswith('.json'):
+                    stamp = SampleIO.file_stamp(os.path.join(directory, name))
+                else:
+                    continue
+                signature.append((name, stamp))
+            return tuple(signature)
+        except OSError:
+            return None
+
+    def _invalidate_timeline(self):
+        """Discard the cached timeline for the current directory after writing to it"""
+        self._timeline_cache.pop(self.current_directory, None)
+
+    def _bind_action(self, component, command):
+        """Call self._<command>() when a button or menu item is activated"""
+        component.setActionCommand(command)
+        component.addActionListener(self._action_dispatcher)
+
     def _create_gui(self):
         """Build the GUI"""
         # Get git version for window title
@@ -258,9 +531,8 @@ class SampleManagerApp:
         timeline_view = self._create_timeline_view()
         self.tabbed_pane.addTab("Timeline", timeline_view)
 
-        # Tab 3: Sample Catalogue
-        catalogue_view = self._create_catalogue_view()
-        self.tabbed_pane.addTab("Sample Catalogue", catalogue_view)
+        # Tab 3: Sample Catalogue - built when first opened, see _on_tab_changed
+        self.tabbed_pane.addTab("Sample Catalogue", JPanel())
 
         # Add tab change listener to refresh catalogue when opened
         self.tabbed_pane.addChangeListener(lambda e: self._on_tab_changed())
@@ -313,7 +585,7 @@ class SampleManagerApp:
         # Browse button (full width)
         btn_browse = JButton('Browse...')
         btn_browse.setToolTipText("Browse for directory")
-        btn_browse.addActionListener(lambda e: self._browse_directory())
+        self._bind_action(btn_browse, 'browse_directory')
         btn_browse.setAlignmentX(Component.LEFT_ALIGNMENT)
         btn_browse.setMaximumSize(Dimension(32767, 28))
         dir_container.add(btn_browse)
@@ -323,7 +595,7 @@ class SampleManagerApp:
         # Current dataset button (full width)
         btn_current = JButton('Go to current dataset')
         btn_current.setToolTipText("Navigate to current TopSpin dataset")
-        btn_current.addActionListener(lambda e: self._navigate_to_curdata())
+        btn_current.addActionListener(lambda e: self._navigate_to_curdata(force=True, background=True))
         btn_current.setAlignmentX(Component.LEFT_ALIGNMENT)
         btn_current.setMaximumSize(Dimension(32767, 28))
         dir_container.add(btn_current)
@@ -381,12 +653,8 @@ class SampleManagerApp:
         self.badge_label = JLabel("EMPTY", JLabel.CENTER)
         self.badge_label.setFont(self.badge_label.getFont().deriveFont(Font.BOLD, 12.0))
         self.badge_label.setOpaque(True)
-        self.badge_label.setBackground(Color(180, 180, 180))  # Grey for empty
         self.badge_label.setForeground(Color.WHITE)
-        self.badge_label.setBorder(BorderFactory.createCompoundBorder(
-            BorderFactory.createLineBorder(Color(140, 140, 140), 2, True),  # Rounded border
-            BorderFactory.createEmptyBorder(8, 15, 8, 15)
-        ))
+        self._set_badge_style('empty')
         self.badge_label.setAlignmentX(Component.CENTER_ALIGNMENT)
 
         # Make badge clickable
@@ -396,7 +664,7 @@ class SampleManagerApp:
         # Detail label - shows timestamp or other info
         self.badge_detail_label = JLabel("No active sample", JLabel.CENTER)
         self.badge_detail_label.setFont(self.badge_detail_label.getFont().deriveFont(Font.PLAIN, 10.0))
-        self.badge_detail_label.setForeground(Color(100, 100, 100))
+        self.badge_detail_label.setForeground(DETAIL_TEXT_COLOR)
         self.badge_detail_label.setAlignmentX(Component.CENTER_ALIGNMENT)
 
         badge_container.add(self.badge_label)
@@ -417,12 +685,12 @@ class SampleManagerApp:
         self.btn_duplicate = JButton('Duplicate...')
         self.btn_new.setToolTipText("Create a new sample")
         self.btn_duplicate.setToolTipText("Duplicate the selected sample")
-        self.btn_new.addActionListener(lambda e: self._new_sample())
-        self.btn_duplicate.addActionListener(lambda e: self._duplicate_sample())
+        self._bind_action(self.btn_new, 'new_sample')
+        self._bind_action(self.btn_duplicate, 'duplicate_sample')
         # Green background for both New and Duplicate (primary actions)
-        self.btn_new.setBackground(Color(200, 230, 200))
+        self.btn_new.setBackground(PRIMARY_BUTTON_COLOR)
         self.btn_new.setOpaque(True)
-        self.btn_duplicate.setBackground(Color(200, 230, 200))
+        self.btn_duplicate.setBackground(PRIMARY_BUTTON_COLOR)
         self.btn_duplicate.setOpaque(True)
         row1.add(self.btn_new)
         row1.add(self.btn_duplicate)
@@ -431,7 +699,7 @@ class SampleManagerApp:
         row2 = JPanel(GridLayout(1, 1, 0, 0))
         self.btn_edit = JButton('Edit')
         self.btn_edit.setToolTipText("Edit the selected sample")
-        self.btn_edit.addActionListener(lambda e: self._edit_sample())
+        self._bind_action(self.btn_edit, 'edit_sample')
         # Light blue background for Edit
         self.btn_edit.setBackground(Color(220, 235, 255))
         self.btn_edit.setOpaque(True)
@@ -441,7 +709,7 @@ class SampleManagerApp:
         row3 = JPanel(GridLayout(1, 1, 0, 0))
         self.btn_eject = JButton('Mark as ejected')
         self.btn_eject.setToolTipText("Mark active sample as ejected")
-        self.btn_eject.addActionListener(lambda e: self._eject_active_sample())
+        self._bind_action(self.btn_eject, 'eject_active_sample')
         # Yellow/amber background for Eject (warning)
         self.btn_eject.setBackground(Color(255, 235, 180))
         self.btn_eject.setOpaque(True)
@@ -451,7 +719,7 @@ class SampleManagerApp:
         row4 = JPanel(GridLayout(1, 1, 0, 0))
         self.btn_delete = JButton('Delete')
         self.btn_delete.setToolTipText("Delete the selected sample (must be ejected)")
-        self.btn_delete.addActionListener(lambda e: self._delete_sample())
+        self._bind_action(self.btn_delete, 'delete_sample')
         # Light red background for Delete (destructive)
         self.btn_delete.setBackground(Color(255, 220, 220))
         self.btn_delete.setOpaque(True)
@@ -461,7 +729,7 @@ class SampleManagerApp:
         row5 = JPanel(GridLayout(1, 1, 0, 0))
         btn_settings = JButton('Settings...')
         btn_settings.setToolTipText("Configure search directories and preferences")
-        btn_settings.addActionListener(lambda e: self._show_settings())
+        self._bind_action(btn_settings, 'show_settings')
         # Light grey background for Settings
         btn_settings.setBackground(Color(240, 240, 240))
         btn_settings.setOpaque(True)
@@ -484,12 +752,14 @@ class SampleManagerApp:
         panel = JPanel(BorderLayout())
         panel.setBorder(BorderFactory.createEmptyBorder(10, 10, 10, 10))
 
-        # Placeholder for form (will be replaced with actual form)
-        self.form_panel = JPanel()
-        self.form_panel.setLayout(BorderLayout())
+        # Form area - placeholder card, and a content card holding the current
+        # form, view or error panel (see _set_form_content)
+        self.form_panel = JPanel(CardLayout())
         placeholder = JLabel("Select a sample or create a new one", JLabel.CENTER)
         placeholder.setFont(placeholder.getFont().deriveFont(Font.ITALIC, 12.0))
-        self.form_panel.add(placeholder, BorderLayout.CENTER)
+        self.form_panel.add(placeholder, "PLACEHOLDER")
+        self.form_content = JPanel(BorderLayout())
+        self.form_panel.add(self.form_content, "CONTENT")
 
         # Add Escape key binding to cancel
         input_map = panel.getInputMap(JComponent.WHEN_ANCESTOR_OF_FOCUSED_COMPONENT)
@@ -513,15 +783,15 @@ class SampleManagerApp:
         self.btn_cancel.setPreferredSize(Dimension(100, 32))
         self.btn_save.setPreferredSize(Dimension(100, 32))
 
-        self.btn_cancel.addActionListener(lambda e: self._cancel_edit())
-        self.btn_save.addActionListener(lambda e: self._save_sample())
+        self._bind_action(self.btn_cancel, 'cancel_edit')
+        self._bind_action(self.btn_save, 'save_sample')
 
         self.btn_cancel.setToolTipText("Cancel editing and clear form")
         self.btn_save.setToolTipText("Save sample to file")
 
         # Make Save button visually primary with color
         self.btn_save.setFont(self.btn_save.getFont().deriveFont(Font.BOLD))
-        self.btn_save.setBackground(Color(200, 230, 200))  # Green
+        self.btn_save.setBackground(PRIMARY_BUTTON_COLOR)  # Green
         self.btn_save.setOpaque(True)
 
         button_row.add(self.btn_cancel)
@@ -545,19 +815,20 @@ class SampleManagerApp:
 
         self.view_sample_btn = JButton("View/edit sample")
         self.view_sample_btn.setEnabled(False)
-        self.view_sample_btn.addActionListener(lambda e: self._view_sample_from_timeline())
+        self._bind_action(self.view_sample_btn, 'view_sample_from_timeline')
         left_panel.add(self.view_sample_btn)
 
         self.open_experiment_btn = JButton("Open experiment in TopSpin")
         self.open_experiment_btn.setEnabled(False)
-        self.open_experiment_btn.addActionListener(lambda e: self._open_experiment_from_timeline())
+        self._bind_action(self.open_experiment_btn, 'open_experiment_from_timeline')
         left_panel.add(self.open_experiment_btn)
 
         top_panel.add(left_panel, BorderLayout.WEST)
 
         # Right side: refresh button
         right_panel = JPanel(FlowLayout(FlowLayout.RIGHT))
-        btn_refresh = JButton('Refresh', actionPerformed=lambda e: self._refresh_timeline())
+        btn_refresh = JButton('Refresh')
+        self._bind_action(btn_refresh, 'refresh_timeline')
         right_panel.add(btn_refresh)
         top_panel.add(right_panel, BorderLayout.EAST)
 
@@ -568,7 +839,7 @@ class SampleManagerApp:
         self.timeline_table = JTable(self.timeline_table_model)
         self.timeline_table.setRowHeight(28)
         self.timeline_table.setShowGrid(True)
-        self.timeline_table.setGridColor(Color(230, 230, 230))
+        self.timeline_table.setGridColor(TABLE_GRID_COLOR)
         self.timeline_table.setAutoCreateRowSorter(True)
 
         # Custom renderer for highlighting
@@ -590,17 +861,17 @@ class SampleManagerApp:
 
         self.create_from_selection_btn = JButton("Create sample from selection")
         self.create_from_selection_btn.setEnabled(False)
-        self.create_from_selection_btn.addActionListener(lambda e: self._create_sample_from_experiments())
+        self._bind_action(self.create_from_selection_btn, 'create_sample_from_experiments')
         bottom_panel.add(self.create_from_selection_btn)
 
         self.reassign_prev_btn = JButton("Reassign to previous sample")
         self.reassign_prev_btn.setEnabled(False)
-        self.reassign_prev_btn.addActionListener(lambda e: self._reassign_to_previous_sample())
+        self._bind_action(self.reassign_prev_btn, 'reassign_to_previous_sample')
         bottom_panel.add(self.reassign_prev_btn)
 
         self.reassign_next_btn = JButton("Reassign to next sample")
         self.reassign_next_btn.setEnabled(False)
-        self.reassign_next_btn.addActionListener(lambda e: self._reassign_to_next_sample())
+        self._bind_action(self.reassign_next_btn, 'reassign_to_next_sample')
         bottom_panel.add(self.reassign_next_btn)
 
         panel.add(bottom_panel, BorderLayout.SOUTH)
@@ -630,7 +901,8 @@ class SampleManagerApp:
         top_panel.add(search_panel, BorderLayout.WEST)
 
         # Refresh button on the right
-        btn_refresh = JButton('Refresh', actionPerformed=lambda e: self._refresh_catalogue())
+        btn_refresh = JButton('Refresh')
+        self._bind_action(btn_refresh, 'refresh_catalogue')
         top_panel.add(btn_refresh, BorderLayout.EAST)
 
         panel.add(top_panel, BorderLayout.NORTH)
@@ -640,7 +912,7 @@ class SampleManagerApp:
         self.catalogue_table = JTable(self.catalogue_table_model)
         self.catalogue_table.setRowHeight(26)
         self.catalogue_table.setShowGrid(True)
-        self.catalogue_table.setGridColor(Color(230, 230, 230))
+        self.catalogue_table.setGridColor(TABLE_GRID_COLOR)
         self.catalogue_table.setAutoCreateRowSorter(True)
         self.catalogue_table.setAutoResizeMode(JTable.AUTO_RESIZE_OFF)  # Allow horizontal scrolling
 
@@ -684,17 +956,20 @@ class SampleManagerApp:
         bottom_panel = JPanel(FlowLayout(FlowLayout.LEFT, 5, 5))
         bottom_panel.setBorder(BorderFactory.createEmptyBorder(5, 0, 0, 0))
 
-        self.catalogue_btn_view = JButton('View', actionPerformed=lambda e: self._catalogue_view_selected())
+        self.catalogue_btn_view = JButton('View')
+        self._bind_action(self.catalogue_btn_view, 'catalogue_view_selected')
         self.catalogue_btn_view.setEnabled(False)
         self.catalogue_btn_view.setToolTipText("View selected sample (read-only)")
         bottom_panel.add(self.catalogue_btn_view)
 
-        self.catalogue_btn_edit = JButton('Edit', actionPerformed=lambda e: self._catalogue_edit_selected())
+        self.catalogue_btn_edit = JButton('Edit')
+        self._bind_action(self.catalogue_btn_edit, 'catalogue_edit_selected')
         self.catalogue_btn_edit.setEnabled(False)
         self.catalogue_btn_edit.setToolTipText("Edit selected sample")
         bottom_panel.add(self.catalogue_btn_edit)
 
-        self.catalogue_btn_duplicate = JButton('Duplicate into current experiment', actionPerformed=lambda e: self._catalogue_duplicate_selected())
+        self.catalogue_btn_duplicate = JButton('Duplicate into current experiment')
+        self._bind_action(self.catalogue_btn_duplicate, 'catalogue_duplicate_selected')
         self.catalogue_btn_duplicate.setEnabled(False)
         self.catalogue_btn_duplicate.setToolTipText("Duplicate selected sample into the current experiment directory")
         bottom_panel.add(self.catalogue_btn_duplicate)
@@ -720,14 +995,15 @@ class SampleManagerApp:
         # Instructions
         instructions = JLabel("Please add search directories using the Settings button")
         instructions.setFont(instructions.getFont().deriveFont(Font.PLAIN, 12.0))
-        instructions.setForeground(Color(100, 100, 100))
+        instructions.setForeground(DETAIL_TEXT_COLOR)
         instructions.setAlignmentX(Component.CENTER_ALIGNMENT)
         panel.add(instructions)
 
         panel.add(Box.createVerticalStrut(20))
 
         # Settings button
-        btn_settings = JButton('Settings...', actionPerformed=lambda e: self._show_settings())
+        btn_settings = JButton('Settings...')
+        self._bind_action(btn_settings, 'show_settings')
         btn_settings.setAlignmentX(Component.CENTER_ALIGNMENT)
         panel.add(btn_settings)
 
@@ -832,8 +1108,24 @@ class SampleManagerApp:
             # Error checking for updates - don't show anything to avoid clutter
             self.update_label.setVisible(False)
 
-    def _navigate_to_curdata(self):
-        """Navigate to current TopSpin dataset directory"""
+    def _navigate_to_curdata(self, force=False, background=False):
+        """Navigate to current TopSpin dataset directory
+
+        Args:
+            force: Query TopSpin even if a recent CURDATA result is cached
+            background: Read the dataset's sample files before switching to the
+                EDT, rather than navigating immediately (see _store_curdata)
+        """
+        # Reuse a recent result rather than making another TopSpin round-trip
+        if not force and self._last_curdata is not None:
+            looked_up, full_path, expno = self._last_curdata
+            if time.time() - looked_up < CURDATA_MAX_AGE:
+                if background:
+                    self._set_directory_later(full_path, expno)
+                else:
+                    self.set_directory(full_path, expno)
+                return
+
         try:
             # CURDATA must be run in a command thread via EXEC_PYSCRIPT
             # We navigate to the parent directory (not the expno subdirectory)
@@ -850,8 +1142,8 @@ if curdata:
     from java.lang import System
     app = System.getProperties().get("org.nmr-samples.topspin")
     if app:
-        app.set_directory(full_path, expno)
-''')
+        app._store_curdata(full_path, expno, %s)
+''' % background)
         except Exception as e:
             self.update_status("Could not navigate to CURDATA: %s" % str(e))
 
@@ -881,7 +1173,6 @@ if curdata:
 ''')
 
             # Give EXEC_PYSCRIPT time to execute
-            import time
             time.sleep(0.2)
 
             # Check stored result
@@ -897,10 +1188,8 @@ if curdata:
                 return True
 
             # Get short directory names for display
-            current_parts = self.current_directory.split(os.sep)
-            curdata_parts = curdata_path.split(os.sep)
-            current_display = os.sep.join(current_parts[-2:]) if len(current_parts) >= 2 else self.current_directory
-            curdata_display = os.sep.join(curdata_parts[-2:]) if len(curdata_parts) >= 2 else curdata_path
+            current_display = self._short_directory(self.current_directory)
+            curdata_display = self._short_directory(curdata_path)
 
             # Directories don't match - offer to change
             result = JOptionPane.showConfirmDialog(
@@ -933,9 +1222,30 @@ if curdata:
             self.update_status("Could not check current dataset: %s" % str(e))
             return True
 
+    def _store_curdata(self, full_path, expno, background=False):
+        """Remember CURDATA lookup result and navigate to it (called from EXEC_PYSCRIPT)"""
+        self._last_curdata = (time.time(), full_path, expno)
+
+        if not background:
+            self.set_directory(full_path, expno)
+            return
+
+        # This runs on a TopSpin command thread, so read sample files and warm
+        # the timeline cache here, then update the window on the EDT
+        try:
+            rows = self._read_sample_rows(full_path)
+            self._build_timeline(full_path)
+        except Exception:
+            rows = None  # set_directory reads again and reports the error
+
+        self._set_directory_later(full_path, expno, rows)
+
     def _store_curdata_check_result(self, curdata_path):
         """Store CURDATA check result (called from EXEC_PYSCRIPT)"""
         self._curdata_check_result = curdata_path
+        # Current dataset has moved on - cached lookup is no longer valid
+        if self._last_curdata is not None and self._last_curdata[1] != curdata_path:
+            self._last_curdata = None
 
     def check_and_switch_to_curdata(self):
         """Public method for external scripts to check and switch to CURDATA if needed.
@@ -959,7 +1269,6 @@ if curdata:
 ''')
 
             # Give EXEC_PYSCRIPT time to execute
-            import time
             time.sleep(0.2)
 
             # Check stored result
@@ -975,10 +1284,8 @@ if curdata:
                 return True
 
             # Get short directory names for display
-            current_parts = self.current_directory.split(os.sep)
-            curdata_parts = curdata_path.split(os.sep)
-            current_display = os.sep.join(current_parts[-2:]) if len(current_parts) >= 2 else self.current_directory
-            curdata_display = os.sep.join(curdata_parts[-2:]) if len(curdata_parts) >= 2 else curdata_path
+            current_display = self._short_directory(self.current_directory)
+            curdata_display = self._short_directory(curdata_path)
 
             # Directories don't match - offer to change
             from javax.swing import JOptionPane
@@ -1011,8 +1318,11 @@ if curdata:
 
     def _browse_directory(self):
         """Browse for directory"""
-        chooser = JFileChooser()
-        chooser.setFileSelectionMode(JFileChooser.DIRECTORIES_ONLY)
+        # Reuse the chooser between clicks - JFileChooser is slow to construct
+        if self.directory_chooser is None:
+            self.directory_chooser = JFileChooser()
+            self.directory_chooser.setFileSelectionMode(JFileChooser.DIRECTORIES_ONLY)
+        chooser = self.directory_chooser
 
         if self.current_directory:
             chooser.setCurrentDirectory(java.io.File(self.current_directory))
@@ -1020,31 +1330,68 @@ if curdata:
         result = chooser.showOpenDialog(self.frame)
         if result == JFileChooser.APPROVE_OPTION:
             selected_dir = chooser.getSelectedFile().getAbsolutePath()
-            self.set_directory(selected_dir)
-
-    def set_directory(self, directory, expno=None, auto_select=True):
+            self._set_directory_later(selected_dir)
+
+    @staticmethod
+    def _short_directory(directory):
+        """Get the last two components of a directory path, for cleaner display"""
+        parent, leaf = os.path.split(directory)
+        grandparent = os.path.basename(parent)
+        return os.path.join(grandparent, leaf) if grandparent else leaf
+
+    def _set_directory_later(self, directory, expno=None, sample_rows=None):
+        """Set current directory shortly afterwards on the EDT
+
+        Requests arriving within DIRECTORY_CHANGE_DELAY_MS of each other are
+        coalesced, so only the last one refreshes the window. For navigation
+        that nothing waits on - use set_directory when the new directory's
+        contents are needed straight away. Safe to call from any thread.
+        """
+        self._pending_directory = (directory, expno, sample_rows)
+        if self._directory_timer is None:
+            self._directory_timer = Timer(DIRECTORY_CHANGE_DELAY_MS,
+                                          lambda e: self._apply_pending_directory())
+            self._directory_timer.setRepeats(False)
+        self._directory_timer.restart()
+
+    def _apply_pending_directory(self):
+        """Set the most recently requested directory (runs on the EDT)"""
+        pending = self._pending_directory
+        self._pending_directory = None
+        if pending is not None:
+            directory, expno, sample_rows = pending
+            self.set_directory(directory, expno, sample_rows=sample_rows)
+
+    def set_directory(self, directory, expno=None, auto_select=True, sample_rows=None, force=False):
         """Set current directory and refresh sample list
 
         Args:
             directory: Directory path to navigate to
             expno: Optional experiment number (as string) for auto-selection
             auto_select: Whether to auto-select a sample
+            sample_rows: Optional (rows, directory mtime) already read from
+                directory by _read_sample_rows
+            force: Reload the sample list and timeline even if already showing directory
         """
-        self.current_directory = directory
-
-        # Show only last two directory components for cleaner display
-        dir_parts = directory.split(os.sep)
-        if len(dir_parts) >= 2:
-            display_dir = os.sep.join(dir_parts[-2:])
-        else:
-            display_dir = directory
-
-        self.dir_label.setText(display_dir)
-        self.dir_label.setToolTipText(directory)  # Full path in tooltip
-
-        self._refresh_sample_list()
-        self._refresh_timeline()
-        self._update_badge()
+        # Re-navigating to the directory already shown (e.g. a repeated CURDATA
+        # lookup or opening a catalogue entry) keeps the current views - the
+        # app refreshes them itself after its own changes. Freshly read rows
+        # are still applied.
+        unchanged = (directory == self.current_directory and sample_rows is None
+                     and not force)
+
+        if not unchanged:
+            self.current_directory = directory
+
+            self.dir_label.setText(self._short_directory(directory))
+            self.dir_label.setToolTipText(directory)  # Full path in tooltip
+
+            if sample_rows is not None:
+                self._sample_list_generation += 1
+                self._apply_sample_rows(*sample_rows)
+            else:
+                self._refresh_sample_list()  # Also updates the badge
+            self._refresh_timeline()
 
         # Check if we should skip auto-select (set by _check_directory_matches_curdata)
         skip_auto_select = getattr(self, '_skip_auto_select', False)
@@ -1092,57 +1439,28 @@ if curdata:
                 return
 
             # Build timeline to find which sample was active during this experiment
-            entries = self.timeline_builder.build_timeline(self.current_directory)
+            entries, experiment_samples = self._get_experiment_samples(self.current_directory)
             print("DEBUG: Built timeline with %d entries" % len(entries))
 
             # Find the sample that was active when this experiment was run
-            # Timeline is sorted chronologically, so we look for:
-            # 1. The most recent sample_created BEFORE this experiment number
-            # 2. Make sure it wasn't ejected before this experiment
-
-            best_sample_filepath = None
-            current_sample_filepath = None
-
-            for entry in entries:
-                if entry.entry_type == 'sample_created':
-                    # New sample became active
-                    current_sample_filepath = entry.filepath
-                    print("DEBUG: Sample created: %s" % entry.filepath)
-                elif entry.entry_type == 'sample_ejected':
-                    # Sample was ejected, no longer active
-                    print("DEBUG: Sample ejected: %s" % current_sample_filepath)
-                    current_sample_filepath = None
-                elif entry.entry_type == 'experiment':
-                    # Check if this is our target experiment
-                    try:
-                        entry_expno = int(entry.name)
-                        print("DEBUG: Found experiment %d (looking for %d)" % (entry_expno, expno))
-                        if entry_expno == expno:
-                            # This is the experiment we want
-                            # The current_sample_filepath is the sample that was active
-                            best_sample_filepath = current_sample_filepath
-                            print("DEBUG: Found target experiment! Best sample: %s" % best_sample_filepath)
-                            break
-                    except (ValueError, AttributeError):
-                        continue
+            # (worked out once per timeline build)
+            best_sample_filepath = experiment_samples.get(expno)
+            print("DEBUG: Best sample for experiment %d: %s" % (expno, best_sample_filepath))
 
             # Find this sample in the table and select it
             if best_sample_filepath:
                 print("DEBUG: Looking for sample in table: %s" % best_sample_filepath)
-                sample_files = self.sample_io.list_sample_files(self.current_directory)
-                for idx, filename in enumerate(sample_files):
-                    filepath = os.path.join(self.current_directory, filename)
-                    if filepath == best_sample_filepath:
-                        print("DEBUG: Found sample at index %d, selecting..." % idx)
-                        self.sample_table.setRowSelectionInterval(idx, idx)
-                        # Scroll to make it visible
-                        self.sample_table.scrollRectToVisible(
-                            self.sample_table.getCellRect(idx, 0, True)
-                        )
-                        # IMPORTANT: Actually load and display the sample
-                        self._on_sample_selected()
-                        print("DEBUG: Sample selected and loaded")
-                        break
+                idx = self.sample_table_model.find_row(os.path.basename(best_sample_filepath))
+                if idx >= 0:
+                    print("DEBUG: Found sample at index %d, selecting..." % idx)
+                    self.sample_table.setRowSelectionInterval(idx, idx)
+                    # Scroll to make it visible
+                    self.sample_table.scrollRectToVisible(
+                        self.sample_table.getCellRect(idx, 0, True)
+                    )
+                    # IMPORTANT: Actually load and display the sample
+                    self._on_sample_selected()
+                    print("DEBUG: Sample selected and loaded")
             else:
                 print("DEBUG: No best_sample_filepath found")
 
@@ -1160,19 +1478,24 @@ if curdata:
             return
 
         try:
-            sample_files = self.sample_io.list_sample_files(self.current_directory)
-            print("DEBUG: Found %d sample files" % len(sample_files))
+            # The sample list has just been refreshed for this directory, so
+            # use its rows (same order as the table) rather than re-listing files
+            rows = [row_data for row_data in self.sample_table_model.rows
+                    if not row_data['is_draft']]
+            print("DEBUG: Found %d sample files" % len(rows))
 
-            if not sample_files:
+            if not rows:
                 print("DEBUG: No sample files found")
                 return
 
-            # First, look for an active (loaded) sample
-            for idx, filename in enumerate(sample_files):
-                filepath = os.path.join(self.current_directory, filename)
-                status = self.sample_io.get_sample_status(filepath)
-                print("DEBUG: Sample %d (%s) has status: %s" % (idx, filename, status))
-                if status == 'loaded':
+            # Look for an active (loaded) sample, noting the most recently
+            # created or modified sample in the same pass in case there is none
+            most_recent_idx = 0
+            most_recent_time = None
+
+            for idx, row_data in enumerate(rows):
+                print("DEBUG: Sample %d (%s) has status: %s" % (idx, row_data['filename'], row_data['status']))
+                if row_data['status'] == 'loaded':
                     print("DEBUG: Found loaded sample at index %d, selecting..." % idx)
                     self.sample_table.setRowSelectionInterval(idx, idx)
                     self.sample_table.scrollRectToVisible(
@@ -1183,23 +1506,15 @@ if curdata:
                     print("DEBUG: Loaded sample selected and displayed")
                     return
 
+                # Use modified timestamp if available, otherwise created
+                timestamp = row_data['modified'] or row_data['created']
+                if timestamp:
+                    if most_recent_time is None or timestamp > most_recent_time:
+                        most_recent_time = timestamp
+                        most_recent_idx = idx
+
             # No active sample - select the most recent by timestamp
-            # Find sample with most recent created or modified timestamp
             print("DEBUG: No loaded sample found, looking for most recent")
-            most_recent_idx = 0
-            most_recent_time = None
-
-            for idx, filename in enumerate(sample_files):
-                filepath = os.path.join(self.current_directory, filename)
-                data = self.sample_io.read_sample(filepath)
-                if data:
-                    metadata = data.get('Metadata', {})
-                    # Use modified timestamp if available, otherwise created
-                    timestamp = metadata.get('modified_timestamp') or metadata.get('created_timestamp')
-                    if timestamp:
-                        if most_recent_time is None or timestamp > most_recent_time:
-                            most_recent_time = timestamp
-                            most_recent_idx = idx
 
             # Select the most recent sample
             if most_recent_time is not None:
@@ -1224,19 +1539,35 @@ if curdata:
         if not self.current_directory:
             return None
 
+        # Use the active row noted when the list was last refreshed, as long as
+        # no files have been added or removed since and it is still loaded
         try:
-            sample_files = self.sample_io.list_sample_files(self.current_directory)
-            for filename in sample_files:
-                filepath = os.path.join(self.current_directory, filename)
-                status = self.sample_io.get_sample_status(filepath)
-                if status == 'loaded':  # Active sample
-                    data = self.sample_io.read_sample(filepath)
+            directory_mtime = os.path.getmtime(self.current_directory)
+        except OSError:
+            directory_mtime = None
+        cached = self._active_sample_row
+        if (cached is not None and directory_mtime is not None
+                and cached[:2] == (self.current_directory, directory_mtime)):
+            row_data = cached[2]
+            if row_data is None:
+                return None
+            if self.sample_io.get_sample_status(row_data['filepath']) == 'loaded':
+                return {
+                    'filename': row_data['filename'],
+                    'filepath': row_data['filepath'],
+                    'label': row_data['label'],
+                    'created': row_data['created']
+                }
+
+        try:
+            samples = self.sample_io.list_sample_summaries(self.current_directory)
+            for filename, filepath, summary in samples:
+                if summary and summary['status'] == 'loaded':  # Active sample
                     return {
                         'filename': filename,
                         'filepath': filepath,
-                        'data': data,
-                        'label': data.get('sample', {}).get('label', filename),
-                        'created': data.get('metadata', {}).get('created_timestamp', '')
+                        'label': summary['label'] or filename,
+                        'created': summary['created']
                     }
         except:
             pass
@@ -1292,11 +1623,7 @@ if curdata:
         self.form_generator = SchemaFormGenerator(self.current_schema_path)
 
         # Create empty form
-        self.form_panel.removeAll()
-        form_scroll = self.form_generator.create_form_panel(self)
-        self.form_panel.add(form_scroll, BorderLayout.CENTER)
-        self.form_panel.revalidate()
-        self.form_panel.repaint()
+        self._set_form_content(self.form_generator.create_form_panel(self))
 
         # Set button states
         self.btn_save.setVisible(True)
@@ -1343,11 +1670,7 @@ if curdata:
             self.form_generator = SchemaFormGenerator(self.current_schema_path)
 
             # Create form first
-            self.form_panel.removeAll()
-            form_scroll = self.form_generator.create_form_panel(self)
-            self.form_panel.add(form_scroll, BorderLayout.CENTER)
-            self.form_panel.revalidate()
-            self.form_panel.repaint()
+            self._set_form_content(self.form_generator.create_form_panel(self))
 
             # Then populate with data
             self.form_generator.load_data(data)
@@ -1363,6 +1686,12 @@ if curdata:
         except Exception as e:
             MSG("Error duplicating sample: %s" % str(e))
 
+    def _set_badge_style(self, status):
+        """Apply the shared background and border for a badge status"""
+        background, border = BADGE_STYLES[status]
+        self.badge_label.setBackground(background)
+        self.badge_label.setBorder(border)
+
     def _update_badge(self):
         """Update the badge to reflect current sample status"""
         if self.is_draft:
@@ -1372,11 +1701,7 @@ if curdata:
                 sample_label = self.draft_data.get('sample', {}).get('label', 'New Sample')
 
             self.badge_label.setText("DRAFT  " + str(sample_label))
-            self.badge_label.setBackground(Color(218, 165, 32))  # Amber/gold
-            self.badge_label.setBorder(BorderFactory.createCompoundBorder(
-                BorderFactory.createLineBorder(Color(184, 134, 11), 2, True),
-                BorderFactory.createEmptyBorder(8, 15, 8, 15)
-            ))
+            self._set_badge_style('draft')
             self.badge_detail_label.setText("Unsaved changes")
             self.btn_eject.setEnabled(False)  # Can't eject a draft
         else:
@@ -1384,26 +1709,13 @@ if curdata:
             if active:
                 # Active sample loaded
                 self.badge_label.setText("ACTIVE  " + str(active['label']))
-                self.badge_label.setBackground(Color(34, 139, 34))  # Forest green
-                self.badge_label.setBorder(BorderFactory.createCompoundBorder(
-                    BorderFactory.createLineBorder(Color(0, 100, 0), 2, True),
-                    BorderFactory.createEmptyBorder(8, 15, 8, 15)
-                ))
+                self._set_badge_style('active')
 
                 # Format timestamp - convert UTC to local time for display
                 created = active['created']
-                if created:
-                    try:
-                        import calendar
-                        # Parse UTC timestamp
-                        dt_utc = datetime.strptime(created[:19], "%Y-%m-%dT%H:%M:%S")
-                        # Convert to local time
-                        utc_timestamp = calendar.timegm(dt_utc.timetuple())
-                        dt_local = datetime.fromtimestamp(utc_timestamp)
-                        time_str = dt_local.strftime("%I:%M %p").lstrip('0')
-                        self.badge_detail_label.setText("Loaded: " + time_str)
-                    except:
-                        self.badge_detail_label.setText("Loaded")
+                time_str = _format_badge_time(created) if created else None
+                if time_str:
+                    self.badge_detail_label.setText("Loaded: " + time_str)
                 else:
                     self.badge_detail_label.setText("Loaded")
 
@@ -1411,116 +1723,186 @@ if curdata:
             else:
                 # Empty - no active sample
                 self.badge_label.setText("EMPTY")
-                self.badge_label.setBackground(Color(180, 180, 180))  # Grey
-                self.badge_label.setBorder(BorderFactory.createCompoundBorder(
-                    BorderFactory.createLineBorder(Color(140, 140, 140), 2, True),
-                    BorderFactory.createEmptyBorder(8, 15, 8, 15)
-                ))
+                self._set_badge_style('empty')
 
-                # Show last ejected sample if any
-                try:
-                    sample_files = self.sample_io.list_sample_files(self.current_directory)
-                    if sample_files:
-                        # Find most recently ejected
-                        last_ejected = None
-                        last_time = None
-                        for filename in sample_files:
-                            filepath = os.path.join(self.current_directory, filename)
-                            data = self.sample_io.read_sample(filepath)
-                            ejected = data.get('metadata', {}).get('ejected_timestamp')
-                            if ejected:
-                                if last_time is None or ejected > last_time:
-                                    last_time = ejected
-                                    last_ejected = data.get('sample', {}).get('label', filename)
-
-                        if last_ejected:
-                            self.badge_detail_label.setText("Last: " + str(last_ejected))
-                        else:
-                            self.badge_detail_label.setText("No active sample")
-                    else:
-                        self.badge_detail_label.setText("No samples")
-                except:
+                # Show last ejected sample if any (found when the list was last refreshed)
+                if self._last_ejected_label:
+                    self.badge_detail_label.setText("Last: " + str(self._last_ejected_label))
+                elif self.sample_table_model.getRowCount() > 0:
                     self.badge_detail_label.setText("No active sample")
+                else:
+                    self.badge_detail_label.setText("No samples")
 
                 self.btn_eject.setEnabled(False)
 
     def _refresh_sample_list(self):
         """Refresh the sample list from current directory"""
+        self._sample_list_generation += 1
+
         if not self.current_directory:
             self.sample_table_model.clear_rows()
+            self._last_ejected_label = None
             self._update_badge()
             return
 
         try:
-            sample_files = self.sample_io.list_sample_files(self.current_directory)
-            rows = []
+            self._apply_sample_rows(*self._read_sample_rows(self.current_directory))
+        except Exception as e:
+            self.update_status("Error refreshing sample list: %s" % str(e))
+            self._update_badge()
 
-            for filename in sample_files:
-                filepath = os.path.join(self.current_directory, filename)
-                status = self.sample_io.get_sample_status(filepath)
+    def _refresh_sample_list_in_background(self):
+        """
+        Refresh the sample list, reading sample files on a background thread
 
-                # Load sample to get label and other info for tooltip
-                try:
-                    data = self.sample_io.read_sample(filepath)
-                    label = data.get('sample', {}).get('label', filename)
-                    created = data.get('metadata', {}).get('created_timestamp', '')
-                    users = data.get('people', {}).get('users', [])
-                except:
-                    label = filename
-                    created = ''
-                    users = []
+        Only for callers that don't use the table contents straight afterwards.
+        Results are applied on the Event Dispatch Thread, and dropped if another
+        refresh has started in the meantime.
+        """
+        import threading
 
-                rows.append({
-                    'status': status,
-                    'label': label,
-                    'filename': filename,
-                    'created': created,
-                    'users': users,
-                    'filepath': filepath,
-                    'is_draft': False
-                })
+        directory = self.current_directory
+        if not directory:
+            self._refresh_sample_list()
+            return
 
-            # Add draft as last row if it exists (chronologically last)
-            if self.is_draft:
-                draft_label = "<new sample>"
-                if self.draft_data:
-                    sample_label = self.draft_data.get('sample', {}).get('label', '')
-                    if sample_label:
-                        # Check if it's a copy
-                        if sample_label.endswith(' (copy)'):
-                            draft_label = "<copy of %s>" % sample_label[:-7]  # Remove " (copy)"
-                        else:
-                            draft_label = "<%s>" % sample_label
+        self._sample_list_generation += 1
+        generation = self._sample_list_generation
 
-                rows.append({
-                    'status': 'draft',
-                    'label': draft_label,
-                    'filename': None,  # No file yet
-                    'created': '',
-                    'users': [],
-                    'filepath': None,
-                    'is_draft': True
-                })
+        def apply_rows(rows):
+            if generation != self._sample_list_generation or directory != self.current_directory:
+                return  # Superseded by a later refresh
+            self._apply_sample_rows(*rows)
 
-            self.sample_table_model.set_rows(rows)
-            self._update_badge()  # Update badge after refreshing list
+        def read_and_apply():
+            try:
+                rows = self._read_sample_rows(directory)
+            except Exception as e:
+                SwingUtilities.invokeLater(
+                    lambda: self.update_status("Error refreshing sample list: %s" % str(e)))
+                return
+            # Update UI on the Event Dispatch Thread
+            SwingUtilities.invokeLater(lambda: apply_rows(rows))
 
-        except Exception as e:
-            self.update_status("Error refreshing sample list: %s" % str(e))
+        thread = threading.Thread(target=read_and_apply)
+        thread.daemon = True
+        thread.start()
+
+    def _read_sample_rows(self, directory):
+        """
+        Read sample files in directory into sample table rows (no Swing access)
+
+        Returns (rows, directory_mtime). The mtime is read before the directory
+        is listed, so files added while the rows are read change it.
+        """
+        try:
+            directory_mtime = os.path.getmtime(directory)
+        except OSError:
+            directory_mtime = None
+        samples = self.sample_io.list_sample_summaries(directory)
+        rows = []
+
+        for filename, filepath, summary in samples:
+            # Get label and other info for tooltip
+            if summary is not None:
+                status = summary['status']
+                label = summary['label'] or filename
+                created = summary['created']
+                modified = summary['modified']
+                ejected = summary['ejected']
+                users = summary['users']
+            else:
+                status = 'unknown'
+                label = filename
+                created = ''
+                modified = ''
+                ejected = ''
+                users = []
+
+            rows.append({
+                'status': status,
+                'label': label,
+                'filename': filename,
+                'created': created,
+                'modified': modified,
+                'ejected': ejected,
+                'users': users,
+                'filepath': filepath,
+                'is_draft': False
+            })
+
+        return rows, directory_mtime
+
+    def _apply_sample_rows(self, rows, directory_mtime):
+        """
+        Show sample rows in the table, adding the draft row if there is one
+
+        Args:
+            rows: Sample table rows from _read_sample_rows
+            directory_mtime: Directory mtime from before the rows were read
+        """
+        # Note the active sample, and the most recently ejected one for the badge
+        active_row = None
+        last_ejected_time = None
+        self._last_ejected_label = None
+        for row_data in rows:
+            if active_row is None and row_data['status'] == 'loaded':
+                active_row = row_data
+            ejected = row_data['ejected']
+            if ejected and (last_ejected_time is None or ejected > last_ejected_time):
+                last_ejected_time = ejected
+                self._last_ejected_label = row_data['label']
+
+        if directory_mtime is not None:
+            self._active_sample_row = (self.current_directory, directory_mtime, active_row)
+        else:
+            self._active_sample_row = None
+
+        # Add draft as last row if it exists (chronologically last)
+        if self.is_draft:
+            draft_label = "<new sample>"
+            if self.draft_data:
+                sample_label = self.draft_data.get('sample', {}).get('label', '')
+                if sample_label:
+                    # Check if it's a copy
+                    if sample_label.endswith(' (copy)'):
+                        draft_label = "<copy of %s>" % sample_label[:-7]  # Remove " (copy)"
+                    else:
+                        draft_label = "<%s>" % sample_label
+
+            rows.append({
+                'status': 'draft',
+                'label': draft_label,
+                'filename': None,  # No file yet
+                'created': '',
+                'modified': '',
+                'ejected': '',
+                'users': [],
+                'filepath': None,
+                'is_draft': True
+            })
+
+        self.sample_table_model.set_rows(rows)
+        self._update_badge()  # Update badge after refreshing list
 
     def _get_schema_path_for_version(self, version):
         """Get schema path for a specific version
 
         Returns:
             str: Path to schema file, or None if not found
+
+        Results are cached - the schemas shipped with the app don't change while it runs.
         """
+        if version in self._schema_path_cache:
+            return self._schema_path_cache[version]
+
         # Try to load the specific version
-        versioned_path = os.path.join(self.script_dir, 'schemas', 'versions', 'v%s' % version, 'schema.json')
-        if os.path.exists(versioned_path):
-            return versioned_path
+        versioned_path = os.path.join(SCHEMA_VERSIONS_DIR, 'v%s' % version, 'schema.json')
+        if not os.path.exists(versioned_path):
+            versioned_path = None  # Schema version not found
 
-        # Schema version not found
-        return None
+        self._schema_path_cache[version] = versioned_path
+        return versioned_path
 
     def _create_schema_error_panel(self, schema_version):
         """Create a panel displaying a schema version error
@@ -1608,14 +1990,19 @@ if curdata:
         # Refresh timeline to highlight this sample's events
         self.timeline_table.repaint()
 
+    def _set_form_content(self, component):
+        """Show component in the form panel, in place of any previous form, view or placeholder"""
+        if component.getParent() is not self.form_content:
+            self.form_content.removeAll()
+            self.form_content.add(component, BorderLayout.CENTER)
+            self.form_content.revalidate()
+        self.form_panel.getLayout().show(self.form_panel, "CONTENT")
+
     def _show_placeholder(self):
         """Show placeholder text in form panel"""
-        self.form_panel.removeAll()
-        placeholder = JLabel("Select a sample or create a new one", JLabel.CENTER)
-        placeholder.setFont(placeholder.getFont().deriveFont(Font.ITALIC, 12.0))
-        self.form_panel.add(placeholder, BorderLayout.CENTER)
-        self.form_panel.revalidate()
-        self.form_panel.repaint()
+        # Placeholder is a prebuilt card - the current content is left in place
+        # so an unchanged form can be reused (see _show_form)
+        self.form_panel.getLayout().show(self.form_panel, "PLACEHOLDER")
 
         # Hide all action buttons in placeholder view
         self.btn_save.setVisible(False)
@@ -1637,11 +2024,7 @@ if curdata:
 
             if schema_path is None:
                 # Schema version not found - show error in form area
-                self.form_panel.removeAll()
-                error_panel = self._create_schema_error_panel(schema_version)
-                self.form_panel.add(error_panel, BorderLayout.CENTER)
-                self.form_panel.revalidate()
-                self.form_panel.repaint()
+                self._set_form_content(self._create_schema_error_panel(schema_version))
                 self.update_status("Cannot display sample - schema v%s not found" % schema_version)
                 return
 
@@ -1654,15 +2037,11 @@ if curdata:
             editor_pane.setEditable(False)
             editor_pane.setCaretPosition(0)  # Reset to top
 
-            # Clear form panel and add HTML view
-            self.form_panel.removeAll()
+            # Replace form panel contents with HTML view
             scroll_pane = JScrollPane(editor_pane)
             scroll_pane.getVerticalScrollBar().setUnitIncrement(16)
             scroll_pane.getVerticalScrollBar().setBlockIncrement(50)
-            self.form_panel.add(scroll_pane, BorderLayout.CENTER)
-
-            self.form_panel.revalidate()
-            self.form_panel.repaint()
+            self._set_form_content(scroll_pane)
 
             # Reset scroll position to top after rendering
             from javax.swing import SwingUtilities
@@ -1682,21 +2061,52 @@ if curdata:
             # Print full traceback for debugging
             traceback.print_exc()
 
-    def _disable_form_components(self, component):
-        """Recursively disable all input components in a container"""
-        if hasattr(component, 'getComponents'):
-            for child in component.getComponents():
-                self._disable_form_components(child)
+    def _show_form(self, schema_path, data):
+        """
+        Show an editable form for schema_path in the form panel and load data into it
+
+        The existing form is reused while the schema is unchanged, so switching
+        samples only reloads field values instead of rebuilding every component.
+        """
+        schema = SchemaFormGenerator._load_schema(schema_path)
+        form_generator = self.form_generator
+
+        if (form_generator is not None and form_generator.form_scroll is not None
+                and form_generator.schema is schema):
+            form_generator.clear()
+        else:
+            form_generator = SchemaFormGenerator(schema_path)
+            form_generator.create_form_panel(self)  # Pass app for modification tracking
+            self.form_generator = form_generator
+
+        # Load data into the form components
+        form_generator.load_data(data)
+
+        form_scroll = form_generator.form_scroll
+        self._set_form_content(form_scroll)
 
-        # Disable ALL interactive components including buttons
-        if isinstance(component, (JTextField, JTextArea, JComboBox, JButton)):
+        # Reused form may have been scrolled - start at the top
+        form_scroll.getVerticalScrollBar().setValue(0)
+
+    def _disable_form_components(self, root):
+        """Disable all input components in a container and its descendants"""
+        # Walk the component tree with an explicit stack rather than recursion
+        stack = [root]
+        while stack:
+            component = stack.pop()
+            if hasattr(component, 'getComponents'):
+                stack.extend(component.getComponents())
+
+            # Disable ALL interactive components including buttons
             if isinstance(component, JButton):
                 # Disable all buttons (including Add/Remove in arrays)
                 component.setEnabled(False)
-            else:
+            elif isinstance(component, JComboBox):
+                component.setEditable(False)
+                component.setEnabled(False)
+            elif isinstance(component, (JTextField, JTextArea)):
                 # Disable input fields
-                component.setEditable(False) if hasattr(component, 'setEditable') else None
-                component.setEnabled(False) if isinstance(component, JComboBox) else None
+                component.setEditable(False)
 
     def _load_sample_into_form(self, filename):
         """Load sample data into form"""
@@ -1713,27 +2123,11 @@ if curdata:
 
             if schema_path is None:
                 # Schema version not found - show error in form area
-                self.form_panel.removeAll()
-                error_panel = self._create_schema_error_panel(schema_version)
-                self.form_panel.add(error_panel, BorderLayout.CENTER)
-                self.form_panel.revalidate()
-                self.form_panel.repaint()
+                self._set_form_content(self._create_schema_error_panel(schema_version))
                 self.update_status("Cannot edit sample - schema v%s not found" % schema_version)
                 return
 
-            # Always create a fresh form generator to avoid stale component references
-            self.form_generator = SchemaFormGenerator(schema_path)
-
-            # Create form panel first
-            self.form_panel.removeAll()
-            form_scroll = self.form_generator.create_form_panel(self)  # Pass app for modification tracking
-            self.form_panel.add(form_scroll, BorderLayout.CENTER)
-
-            # THEN load data into the now-created components
-            self.form_generator.load_data(data)
-
-            self.form_panel.revalidate()
-            self.form_panel.repaint()
+            self._show_form(schema_path, data)
 
             # Reset modification flag and disable Save, but enable Cancel
             self.form_modified = False
@@ -1779,8 +2173,8 @@ if curdata:
             # Eject the active sample
             try:
                 self.sample_io.eject_sample(active['filepath'])
-                self._refresh_sample_list()
-                self._refresh_timeline()
+                self._invalidate_timeline()
+                self._refresh_timeline_later()
             except Exception as e:
                 MSG("Error marking sample as ejected: %s" % str(e))
                 return
@@ -1799,11 +2193,7 @@ if curdata:
         self.form_generator = SchemaFormGenerator(self.current_schema_path)
 
         # Create empty form
-        self.form_panel.removeAll()
-        form_scroll = self.form_generator.create_form_panel(self)  # Pass app for modification tracking
-        self.form_panel.add(form_scroll, BorderLayout.CENTER)
-        self.form_panel.revalidate()
-        self.form_panel.repaint()
+        self._set_form_content(self.form_generator.create_form_panel(self))  # Pass app for modification tracking
 
         # Set button states
         self.btn_save.setEnabled(False)
@@ -1870,8 +2260,8 @@ if curdata:
             # Eject the active sample
             try:
                 self.sample_io.eject_sample(active['filepath'])
-                self._refresh_sample_list()
-                self._refresh_timeline()
+                self._invalidate_timeline()
+                self._refresh_timeline_later()
             except Exception as e:
                 MSG("Error marking sample as ejected: %s" % str(e))
                 return
@@ -1899,19 +2289,8 @@ if curdata:
             self._update_badge()
             self._refresh_sample_list()  # Refresh to show draft in list
 
-            # Create fresh form generator using CURRENT schema for duplicates
-            self.form_generator = SchemaFormGenerator(self.current_schema_path)
-
-            # Create form first
-            self.form_panel.removeAll()
-            form_scroll = self.form_generator.create_form_panel(self)  # Pass app for modification tracking
-            self.form_panel.add(form_scroll, BorderLayout.CENTER)
-
-            # Then load data
-            self.form_generator.load_data(data)
-
-            self.form_panel.revalidate()
-            self.form_panel.repaint()
+            # Use CURRENT schema for duplicates
+            self._show_form(self.current_schema_path, data)
 
             # Set button states
             self.btn_save.setEnabled(False)
@@ -1972,8 +2351,9 @@ if curdata:
 
         try:
             self.sample_io.eject_sample(active['filepath'])
-            self._refresh_sample_list()
-            self._refresh_timeline()
+            self._invalidate_timeline()
+            self._refresh_sample_list_in_background()
+            self._refresh_timeline_later()
             self._update_badge()
             self.update_status("Marked as ejected: %s" % active['label'])
         except Exception as e:
@@ -2011,9 +2391,10 @@ if curdata:
 
         try:
             filepath = os.path.join(self.current_directory, self.current_sample_file)
-            os.remove(filepath)
-            self._refresh_sample_list()
-            self._refresh_timeline()
+            self.sample_io.delete_sample(filepath)
+            self._invalidate_timeline()
+            self._refresh_sample_list_in_background()
+            self._refresh_timeline_later()
             self._show_placeholder()
             self.current_sample_file = None
             self.selected_sample_filepath = None
@@ -2045,17 +2426,15 @@ if curdata:
                 is_new = False
 
                 # When editing existing sample, preserve existing metadata
+                # (from the cached summary - the full document isn't needed)
                 filepath = os.path.join(self.current_directory, filename)
                 try:
-                    existing_data = self.sample_io.read_sample(filepath)
-                    # Preserve metadata fields that shouldn't be changed by editing
-                    if 'metadata' in existing_data:
-                        if 'metadata' not in data:
-                            data['metadata'] = {}
-                        # Preserve creation timestamp and ejection timestamp
-                        data['metadata']['created_timestamp'] = existing_data['metadata'].get('created_timestamp')
-                        if 'ejected_timestamp' in existing_data['metadata']:
-                            data['metadata']['ejected_timestamp'] = existing_data['metadata'].get('ejected_timestamp')
+                    existing = self.sample_io.read_summary(filepath)
+                    # Preserve creation timestamp and ejection timestamp
+                    if existing['created']:
+                        data.setdefault('metadata', {})['created_timestamp'] = existing['created']
+                    if existing['ejected']:
+                        data.setdefault('metadata', {})['ejected_timestamp'] = existing['ejected']
                 except:
                     pass  # If we can't read existing, proceed without preserved metadata
 
@@ -2063,13 +2442,14 @@ if curdata:
 
             # Write sample
             self.sample_io.write_sample(filepath, data, is_new=is_new)
+            self._invalidate_timeline()
 
             # Clear draft state BEFORE refreshing list
             self.is_draft = False
             self.draft_data = None
 
             self._refresh_sample_list()
-            self._refresh_timeline()
+            self._refresh_timeline_later()
 
             # Reset modification flag and disable buttons
             self.form_modified = False
@@ -2083,13 +2463,11 @@ if curdata:
             self.current_sample_file = filename
 
             # Find and select this sample in the table
-            for row_idx in range(self.sample_table_model.getRowCount()):
-                row_data = self.sample_table_model.get_row(row_idx)
-                if row_data['filename'] == filename:
-                    self.sample_table.setRowSelectionInterval(row_idx, row_idx)
-                    # Force reload in read-only view
-                    self._on_sample_selected()
-                    break
+            row_idx = self.sample_table_model.find_row(filename)
+            if row_idx >= 0:
+                self.sample_table.setRowSelectionInterval(row_idx, row_idx)
+                # Force reload in read-only view
+                self._on_sample_selected()
 
             self.update_status("Saved sample: %s" % filename)
 
@@ -2134,13 +2512,11 @@ if curdata:
         if sample_to_reload:
             # Re-select the row in the table which will trigger _on_sample_selected
             # This will properly reload it in read-only view
-            for row_idx in range(self.sample_table_model.getRowCount()):
-                row_data = self.sample_table_model.get_row(row_idx)
-                if row_data['filename'] == sample_to_reload:
-                    self.sample_table.setRowSelectionInterval(row_idx, row_idx)
-                    # Force the selection event to fire
-                    self._on_sample_selected()
-                    break
+            row_idx = self.sample_table_model.find_row(sample_to_reload)
+            if row_idx >= 0:
+                self.sample_table.setRowSelectionInterval(row_idx, row_idx)
+                # Force the selection event to fire
+                self._on_sample_selected()
         else:
             self.current_sample_file = None
             self._show_placeholder()
@@ -2150,13 +2526,22 @@ if curdata:
     def _on_tab_changed(self):
         """Handle tab change - refresh catalogue when Samples tab is opened"""
         if self.tabbed_pane.getSelectedIndex() == 2:  # Samples tab (index 2)
-            self._refresh_catalogue()
-            # If a sample is selected, find and select it in the catalogue
-            if self.selected_sample_filepath:
-                self._select_sample_in_catalogue(self.selected_sample_filepath)
+            if self.catalogue_table is None:
+                # First visit - replace the placeholder with the real view
+                self.tabbed_pane.setComponentAt(2, self._create_catalogue_view())
+            # Once scanned, find and select the selected sample in the catalogue
+            self._refresh_catalogue(on_done=lambda: self._select_sample_in_catalogue(
+                self.selected_sample_filepath) if self.selected_sample_filepath else None)
+
+    def _refresh_catalogue(self, on_done=None):
+        """Refresh the sample catalogue
 
-    def _refresh_catalogue(self):
-        """Refresh the sample catalogue"""
+        Directories are scanned on a background thread and samples are added
+        to the table as they are found.
+
+        Args:
+            on_done: Optional function called on the EDT once the scan is complete
+        """
         if not self.catalogue_table_model:
             return
 
@@ -2164,7 +2549,8 @@ if curdata:
         roots = self.config.get_search_roots()
 
         if not roots:
-            # Show empty state
+            # Show empty state, dropping results from any scan still running
+            self._catalogue_generation += 1
             self.catalogue_table_model.clear_rows()
             if self.catalogue_center_panel:
                 card_layout = self.catalogue_center_panel.getLayout()
@@ -2179,13 +2565,57 @@ if curdata:
 
         self.update_status("Scanning directories for samples...")
 
-        # Scan directories for samples
-        try:
-            samples = self.sample_scanner.scan_roots(roots)
-            self.catalogue_table_model.set_rows(samples)
-            self.update_status("Found %d samples in %d directories" % (len(samples), len(roots)))
-        except Exception as e:
-            self.update_status("Error scanning directories: %s" % str(e))
+        import threading
+
+        self._catalogue_generation += 1
+        generation = self._catalogue_generation
+        first_batch = [True]  # First batch replaces the previous scan's rows
+
+        def add_batch(batch):
+            if generation != self._catalogue_generation:
+                return  # Superseded by a later refresh
+            if first_batch[0]:
+                first_batch[0] = False
+                self.catalogue_table_model.set_rows(batch)
+            else:
+                self.catalogue_table_model.add_rows(batch)
+
+        def finish(samples):
+            if generation != self._catalogue_generation:
+                return
+            if first_batch[0]:
+                # Nothing found - clear the previous scan's rows
+                self.catalogue_table_model.set_rows([])
+            # Don't overwrite other status messages when refreshed in the background
+            if self.tabbed_pane.getSelectedIndex() == 2:
+                self.update_status("Found %d samples in %d directories" % (len(samples), len(roots)))
+            if on_done:
+                on_done()
+
+        def scan():
+            # Scan directories for samples, showing them on the EDT in batches.
+            # A later refresh stops this scan so it can take the scanner's lock
+            try:
+                samples = self.sample_scanner.scan_roots(
+                    roots, progress=lambda batch: SwingUtilities.invokeLater(lambda: add_batch(batch)),
+                    cancelled=lambda: generation != self._catalogue_generation)
+            except Exception as e:
+                SwingUtilities.invokeLater(
+                    lambda: self.update_status("Error scanning directories: %s" % str(e)))
+                return
+            SwingUtilities.invokeLater(lambda: finish(samples))
+
+        thread = threading.Thread(target=scan)
+        thread.daemon = True
+        thread.start()
+
+    def _read_catalogue_sample(self, row_data):
+        """Get a copy of the sample data for a catalogue row
+
+        Reads through SampleIO, whose cache already holds the file parsed
+        during the catalogue scan unless it has changed on disk since.
+        """
+        return self.sample_io.read_sample(row_data['filepath'])
 
     def _select_sample_in_catalogue(self, filepath):
         """Select a sample in the catalogue table by filepath
@@ -2197,23 +2627,23 @@ if curdata:
             return
 
         # Find the sample in the catalogue rows
-        for idx in range(self.catalogue_table_model.getRowCount()):
-            row_data = self.catalogue_table_model.get_row(idx)
-            if row_data and row_data.get('filepath') == filepath:
-                # Found it - select the row (accounting for sorting)
-                try:
-                    view_idx = self.catalogue_table.convertRowIndexToView(idx)
-                    self.catalogue_table.setRowSelectionInterval(view_idx, view_idx)
-                    self.catalogue_table.scrollRectToVisible(
-                        self.catalogue_table.getCellRect(view_idx, 0, True)
-                    )
-                except:
-                    # If conversion fails, just select by model index
-                    self.catalogue_table.setRowSelectionInterval(idx, idx)
-                    self.catalogue_table.scrollRectToVisible(
-                        self.catalogue_table.getCellRect(idx, 0, True)
-                    )
-                break
+        idx = self.catalogue_table_model.find_row(filepath)
+        if idx < 0:
+            return
+
+        # Select the row (accounting for sorting)
+        try:
+            view_idx = self.catalogue_table.convertRowIndexToView(idx)
+            self.catalogue_table.setRowSelectionInterval(view_idx, view_idx)
+            self.catalogue_table.scrollRectToVisible(
+                self.catalogue_table.getCellRect(view_idx, 0, True)
+            )
+        except:
+            # If conversion fails, just select by model index
+            self.catalogue_table.setRowSelectionInterval(idx, idx)
+            self.catalogue_table.scrollRectToVisible(
+                self.catalogue_table.getCellRect(idx, 0, True)
+            )
 
     def handle_catalogue_double_click(self, sample_info):
         """Handle double-click on catalogue entry - navigate to sample location
@@ -2229,16 +2659,14 @@ if curdata:
             self.set_directory(directory, auto_select=False)
 
             # Find and select the sample in the list
-            sample_files = self.sample_io.list_sample_files(directory)
-            for idx, f in enumerate(sample_files):
-                if f == filename:
-                    self.sample_table.setRowSelectionInterval(idx, idx)
-                    self.sample_table.scrollRectToVisible(
-                        self.sample_table.getCellRect(idx, 0, True)
-                    )
-                    # Switch to Sample Details tab
-                    self.tabbed_pane.setSelectedIndex(0)
-                    break
+            idx = self.sample_table_model.find_row(filename)
+            if idx >= 0:
+                self.sample_table.setRowSelectionInterval(idx, idx)
+                self.sample_table.scrollRectToVisible(
+                    self.sample_table.getCellRect(idx, 0, True)
+                )
+                # Switch to Sample Details tab
+                self.tabbed_pane.setSelectedIndex(0)
 
     def _on_catalogue_selection_changed(self):
         """Handle selection change in catalogue table - enable/disable buttons"""
@@ -2287,16 +2715,14 @@ if curdata:
             self.set_directory(directory, auto_select=False)
 
             # Find and select the sample in the list
-            sample_files = self.sample_io.list_sample_files(directory)
-            for idx, f in enumerate(sample_files):
-                if f == filename:
-                    self.current_sample_file = filename
-                    self.sample_table.setRowSelectionInterval(idx, idx)
-                    # Trigger edit mode
-                    self._edit_sample()
-                    # Switch to Sample Details tab
-                    self.tabbed_pane.setSelectedIndex(0)
-                    break
+            idx = self.sample_table_model.find_row(filename)
+            if idx >= 0:
+                self.current_sample_file = filename
+                self.sample_table.setRowSelectionInterval(idx, idx)
+                # Trigger edit mode
+                self._edit_sample()
+                # Switch to Sample Details tab
+                self.tabbed_pane.setSelectedIndex(0)
 
     def _catalogue_duplicate_selected(self):
         """Duplicate button handler - duplicate selected sample into current directory"""
@@ -2315,7 +2741,7 @@ if curdata:
 
         try:
             # Read the sample data
-            data = self.sample_io.read_sample(filepath)
+            data = self._read_catalogue_sample(row_data)
 
             # Append "(copy)" to label
             if 'Sample' in data and 'Label' in data['Sample']:
@@ -2343,8 +2769,8 @@ if curdata:
 
                 # Eject the active sample
                 self.sample_io.eject_sample(active['filepath'])
-                self._refresh_sample_list()
-                self._refresh_timeline()
+                self._invalidate_timeline()
+                self._refresh_timeline_later()
 
             # Set draft state
             self.current_sample_file = None
@@ -2360,15 +2786,12 @@ if curdata:
             self.form_generator = SchemaFormGenerator(self.current_schema_path)
 
             # Create form first
-            self.form_panel.removeAll()
             form_scroll = self.form_generator.create_form_panel(self)
-            self.form_panel.add(form_scroll, BorderLayout.CENTER)
 
             # Then load data
             self.form_generator.load_data(data)
 
-            self.form_panel.revalidate()
-            self.form_panel.repaint()
+            self._set_form_content(form_scroll)
 
             # Set button states
             self.btn_new.setEnabled(True)
@@ -2392,27 +2815,50 @@ if curdata:
         except Exception as e:
             MSG("Error duplicating sample: %s" % str(e))
 
+    def _refresh_timeline_later(self):
+        """Refresh the timeline view shortly afterwards on the EDT
+
+        Requests arriving within TIMELINE_REFRESH_DELAY_MS of each other are
+        coalesced into one rebuild, and the current action finishes (and the
+        sample list repaints) first. For callers that don't use the timeline
+        rows straight afterwards.
+        """
+        if self._timeline_timer is None:
+            self._timeline_timer = Timer(TIMELINE_REFRESH_DELAY_MS,
+                                         lambda e: self._refresh_timeline())
+            self._timeline_timer.setRepeats(False)
+        self._timeline_timer.restart()
+
     def _refresh_timeline(self):
         """Refresh timeline view"""
+        if self._timeline_timer is not None:
+            self._timeline_timer.stop()  # This refresh covers any pending one
+
         if not self.current_directory:
             self.timeline_table_model.clear_rows()
+            self._timeline_rows_entries = None
             return
 
         try:
-            entries = self.timeline_builder.build_timeline(self.current_directory)
+            entries = self._build_timeline(self.current_directory)
+            if entries is self._timeline_rows_entries:
+                return  # Timeline unchanged since the rows were built - keep them
 
-            # Check if we need a holder column (any non-zero holder values or multiple different holders)
+            # Check if we need a holder column (any non-zero holder values or multiple
+            # different holders) and if we have any sample events, in one pass
             holder_values = set()
+            has_samples = False
             for entry in entries:
-                if entry.entry_type == 'experiment' and entry.holder is not None:
-                    holder_values.add(entry.holder)
+                entry_type = entry.entry_type
+                if entry_type == 'experiment':
+                    if entry.holder is not None:
+                        holder_values.add(entry.holder)
+                elif entry_type in SAMPLE_EVENT_TYPES:
+                    has_samples = True
 
             # Show holder column if we have multiple different values or any non-zero values
             show_holder = len(holder_values) > 1 or (len(holder_values) == 1 and 0 not in holder_values)
 
-            # Check if we have any sample events
-            has_samples = any(entry.entry_type in ('sample_created', 'sample_ejected') for entry in entries)
-
             rows = []
             current_sample_filepath = None
             current_holder = None
@@ -2430,42 +2876,16 @@ if curdata:
                     sample_was_ejected = False
 
                 # Convert UTC timestamp to local time for display
-                import calendar
-                import time
-                # Convert datetime to timestamp, then to local time
-                utc_timestamp = calendar.timegm(entry.timestamp.timetuple())
-                local_dt = datetime.fromtimestamp(utc_timestamp)
-
-                # Format timestamp for display - capitalize, no zero padding
-                # Manual formatting for cross-platform compatibility
-                day_name = local_dt.strftime("%a")  # Mon, Tue, etc.
-                day = local_dt.day  # 1-31, no zero padding
-                month = local_dt.strftime("%b")  # Jan, Feb, etc.
-                year = local_dt.year
-                hour = local_dt.hour
-                minute = local_dt.minute
-
-                # Convert to 12-hour format
-                if hour == 0:
-                    hour_12 = 12
-                    am_pm = "AM"
-                elif hour < 12:
-                    hour_12 = hour
-                    am_pm = "AM"
-                elif hour == 12:
-                    hour_12 = 12
-                    am_pm = "PM"
-                else:
-                    hour_12 = hour - 12
-                    am_pm = "PM"
-
-                timestamp_str = "%s %d %s %d, %d.%02d %s" % (day_name, day, month, year, hour_12, minute, am_pm)
+                timestamp_str = _format_timeline_time(entry.timestamp)
 
                 # Determine display name and sample filepath for this row
                 row_sample_filepath = current_sample_filepath
                 is_orphan = False
+                holder_str = ""  # Holder and parmod are only shown for experiments
+                parmod = None
 
-                if entry.entry_type == 'sample_created':
+                entry_type = entry.entry_type
+                if entry_type == 'sample_created':
                     display_name = entry.name
                     # Toggle if different sample
                     if current_sample_filepath != entry.filepath:
@@ -2474,7 +2894,7 @@ if curdata:
                     current_sample_filepath = entry.filepath
                     current_sample_created_time = entry.timestamp
                     current_sample_ejected_time = None
-                elif entry.entry_type == 'sample_ejected':
+                elif entry_type == 'sample_ejected':
                     display_name = "sample ejected"
                     # Ejection event uses current sample colour for this row
                     row_sample_filepath = current_sample_filepath
@@ -2482,7 +2902,7 @@ if curdata:
                     # Set flag so next row gets new colour
                     sample_was_ejected = True
                     current_sample_filepath = None
-                elif entry.entry_type == 'experiment':
+                elif entry_type == 'experiment':
                     # Detect orphaned experiments (only if we have samples defined)
                     if has_samples:
                         # Experiment is orphaned if:
@@ -2504,11 +2924,13 @@ if curdata:
                     else:
                         display_name = "Exp %s" % entry.name
 
-                    # If no samples defined, use holder for color alternation
-                    if not has_samples and show_holder and entry.holder is not None:
-                        if current_holder != entry.holder:
+                    if entry.holder is not None:
+                        holder_str = str(entry.holder)
+                        # If no samples defined, use holder for color alternation
+                        if not has_samples and show_holder and current_holder != entry.holder:
                             toggle = True
                             current_holder = entry.holder
+                    parmod = entry.parmod
                 else:
                     display_name = entry.name
 
@@ -2522,11 +2944,6 @@ if curdata:
                 if details and ',' in details:
                     details = details.split(',')[0].strip()  # Just the pulse program
 
-                # Get holder value (only for experiments)
-                holder_str = ""
-                if entry.entry_type == 'experiment' and entry.holder is not None:
-                    holder_str = str(entry.holder)
-
                 rows.append({
                     'timestamp': timestamp_str,
                     'name': display_name,
@@ -2535,22 +2952,22 @@ if curdata:
                     'entry': entry,
                     'sample_filepath': row_sample_filepath,  # For highlighting
                     'color_index': current_sample_color_index,  # For consistent coloring
-                    'parmod': entry.parmod if entry.entry_type == 'experiment' else None,  # For dimensionality coloring
+                    'parmod': parmod,  # For dimensionality coloring
                     'is_orphan': is_orphan  # Flag orphaned experiments
                 })
 
-            self.timeline_table_model.set_rows(rows, show_holder)
-
-            # Configure column widths after structure changes
-            col_model = self.timeline_table.getColumnModel()
-            col_model.getColumn(0).setPreferredWidth(220)  # Date/Time
-            col_model.getColumn(1).setPreferredWidth(180)  # Sample/Experiment
+            self._timeline_rows_entries = entries
+            if self.timeline_table_model.set_rows(rows, show_holder):
+                # Configure column widths after structure changes
+                col_model = self.timeline_table.getColumnModel()
+                col_model.getColumn(0).setPreferredWidth(220)  # Date/Time
+                col_model.getColumn(1).setPreferredWidth(180)  # Sample/Experiment
 
-            if show_holder:
-                col_model.getColumn(2).setPreferredWidth(60)   # Holder
-                col_model.getColumn(3).setPreferredWidth(250)  # Details
-            else:
-                col_model.getColumn(2).setPreferredWidth(250)  # Details
+                if show_holder:
+                    col_model.getColumn(2).setPreferredWidth(60)   # Holder
+                    col_model.getColumn(3).setPreferredWidth(250)  # Details
+                else:
+                    col_model.getColumn(2).setPreferredWidth(250)  # Details
 
         except Exception as e:
             self.update_status("Error refreshing timeline: %s" % str(e))
@@ -2677,19 +3094,17 @@ if curdata:
 
         # Find this sample in the sample table and select it
         filename = os.path.basename(sample_filepath)
-        sample_files = self.sample_io.list_sample_files(self.current_directory)
+        idx = self.sample_table_model.find_row(filename)
 
-        for idx, fname in enumerate(sample_files):
-            if fname == filename:
-                self.sample_table.setRowSelectionInterval(idx, idx)
-                self.sample_table.scrollRectToVisible(
-                    self.sample_table.getCellRect(idx, 0, True)
-                )
-                # Switch to Sample Details tab
-                self.tabbed_pane.setSelectedIndex(0)
-                # Edit the sample
-                self._edit_sample()
-                break
+        if idx >= 0:
+            self.sample_table.setRowSelectionInterval(idx, idx)
+            self.sample_table.scrollRectToVisible(
+                self.sample_table.getCellRect(idx, 0, True)
+            )
+            # Switch to Sample Details tab
+            self.tabbed_pane.setSelectedIndex(0)
+            # Edit the sample
+            self._edit_sample()
 
     def _open_experiment_from_timeline(self):
         """Open the selected experiment in TopSpin"""
@@ -2745,7 +3160,7 @@ if curdata:
             row_data = model.get_row(row)
             if row_data and 'entry' in row_data:
                 entry = row_data['entry']
-                if entry.entry_type in ('sample_created', 'sample_ejected'):
+                if entry.entry_type in SAMPLE_EVENT_TYPES:
                     filepath = row_data.get('sample_filepath')
                     if filepath:
                         try:
@@ -2779,9 +3194,8 @@ if curdata:
             # Load schema to get version
             schema_version = '0.1.0'  # Default version
             try:
-                with open(self.current_schema_path, 'r') as f:
-                    schema = json.load(f)
-                    schema_version = schema.get('version', '0.1.0')
+                schema = SchemaFormGenerator._load_schema(self.current_schema_path)
+                schema_version = schema.get('version', '0.1.0')
             except:
                 pass  # Use default if can't read schema
 
@@ -2815,24 +3229,23 @@ if curdata:
 
             # Save the sample (it's already ejected, so no auto-eject logic)
             self.sample_io.write_sample(filepath, sample_data)
+            self._invalidate_timeline()
 
             # Refresh views
             self._refresh_sample_list()
-            self._refresh_timeline()
+            self._refresh_timeline_later()
             self._refresh_catalogue()
 
             # Select the new sample in the list and open for editing
-            sample_files = self.sample_io.list_sample_files(self.current_directory)
-            for idx, fname in enumerate(sample_files):
-                if fname == filename:
-                    self.sample_table.setRowSelectionInterval(idx, idx)
-                    self.sample_table.scrollRectToVisible(
-                        self.sample_table.getCellRect(idx, 0, True)
-                    )
-                    # Switch to Sample Details tab and edit
-                    self.tabbed_pane.setSelectedIndex(0)
-                    self._edit_sample()
-                    break
+            idx = self.sample_table_model.find_row(filename)
+            if idx >= 0:
+                self.sample_table.setRowSelectionInterval(idx, idx)
+                self.sample_table.scrollRectToVisible(
+                    self.sample_table.getCellRect(idx, 0, True)
+                )
+                # Switch to Sample Details tab and edit
+                self.tabbed_pane.setSelectedIndex(0)
+                self._edit_sample()
 
             self.update_status("Created retrospective sample for %d experiments" % len(experiments))
 
@@ -3009,10 +3422,11 @@ if curdata:
             sample_data['metadata']['modified_timestamp'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
             self.sample_io.write_sample(previous_sample_filepath, sample_data)
+            self._invalidate_timeline()
 
             # Refresh views
-            self._refresh_sample_list()
-            self._refresh_timeline()
+            self._refresh_sample_list_in_background()
+            self._refresh_timeline_later()
             self._refresh_catalogue()
 
             self.update_status("Reassigned %d experiments to previous sample" % len(experiments))
@@ -3138,10 +3552,11 @@ if curdata:
             sample_data['metadata']['modified_timestamp'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
             self.sample_io.write_sample(next_sample_filepath, sample_data)
+            self._invalidate_timeline()
 
             # Refresh views
-            self._refresh_sample_list()
-            self._refresh_timeline()
+            self._refresh_sample_list_in_background()
+            self._refresh_timeline_later()
             self._refresh_catalogue()
 
             self.update_status("Reassigned %d experiments to next sample" % len(experiments))
@@ -3211,9 +3626,8 @@ if curdata:
             # Load schema to get version
             schema_version = '0.1.0'  # Default version
             try:
-                with open(self.current_schema_path, 'r') as f:
-                    schema = json.load(f)
-                    schema_version = schema.get('version', '0.1.0')
+                schema = SchemaFormGenerator._load_schema(self.current_schema_path)
+                schema_version = schema.get('version', '0.1.0')
             except:
                 pass  # Use default if can't read schema
 
@@ -3239,24 +3653,23 @@ if curdata:
 
             # Save the sample
             self.sample_io.write_sample(filepath, sample_data)
+            self._invalidate_timeline()
 
             # Refresh views
             self._refresh_sample_list()
-            self._refresh_timeline()
+            self._refresh_timeline_later()
             self._refresh_catalogue()
 
             # Select the new sample in the list and open for editing
-            sample_files = self.sample_io.list_sample_files(self.current_directory)
-            for idx, fname in enumerate(sample_files):
-                if fname == filename:
-                    self.sample_table.setRowSelectionInterval(idx, idx)
-                    self.sample_table.scrollRectToVisible(
-                        self.sample_table.getCellRect(idx, 0, True)
-                    )
-                    # Switch to Sample Details tab and edit
-                    self.tabbed_pane.setSelectedIndex(0)
-                    self._edit_sample()
-                    break
+            idx = self.sample_table_model.find_row(filename)
+            if idx >= 0:
+                self.sample_table.setRowSelectionInterval(idx, idx)
+                self.sample_table.scrollRectToVisible(
+                    self.sample_table.getCellRect(idx, 0, True)
+                )
+                # Switch to Sample Details tab and edit
+                self.tabbed_pane.setSelectedIndex(0)
+                self._edit_sample()
 
             self.update_status("Created new sample for %d experiments" % len(experiments))
 
@@ -3286,8 +3699,10 @@ if curdata:
         thread.start()
 
     def show(self):
-        """Show the window if hidden"""
-        if self.frame is not None:
+        """Show the window if hidden, building it on first use"""
+        if self.frame is None:
+            self.build_gui()
+        else:
             self.frame.setVisible(True)
             self.frame.toFront()
             self.frame.requestFocus()
@@ -3309,6 +3724,8 @@ class SampleTableModel(AbstractTableModel):
 
     def __init__(self):
         self.rows = []
+        self.row_index = {}  # Row number by filename
+        self.tooltips = []  # Tooltip text by row, see set_rows
         self.column_names = ['', 'Sample']
 
     def getColumnCount(self):
@@ -3336,20 +3753,56 @@ class SampleTableModel(AbstractTableModel):
             return self.rows[row]
         return None
 
+    def find_row(self, filename):
+        """Get row number for a sample filename, or -1 if not listed"""
+        return self.row_index.get(filename, -1)
+
+    def get_tooltip(self, row):
+        """Get tooltip text for a row, or None if out of range"""
+        if row >= 0 and row < len(self.tooltips):
+            return self.tooltips[row]
+        return None
+
+    @staticmethod
+    def _format_tooltip(row_data):
+        """Format the HTML tooltip describing a row's sample file"""
+        created = row_data.get('created', '')
+        users = row_data.get('users', [])
+        users_str = ', '.join(users) if users else 'None'
+        return "<html><b>File:</b> %s<br><b>Created:</b> %s<br><b>Users:</b> %s</html>" % (
+            row_data.get('filename', ''), created[:19] if created else 'Unknown', users_str)
+
     def set_rows(self, rows):
         """Replace all rows"""
         self.rows = rows
+        self.row_index = dict((row_data['filename'], idx) for idx, row_data in enumerate(rows)
+                              if row_data['filename'] is not None)
+        # Tooltips are built here so the renderer does no formatting while painting
+        self.tooltips = [self._format_tooltip(row_data) for row_data in rows]
         self.fireTableDataChanged()
 
     def clear_rows(self):
         """Clear all rows"""
         self.rows = []
+        self.row_index = {}
+        self.tooltips = []
         self.fireTableDataChanged()
 
 
 class SampleTableCellRenderer(DefaultTableCellRenderer):
     """Custom cell renderer for sample table with status icons"""
 
+    def __init__(self):
+        DefaultTableCellRenderer.__init__(self)
+        # Status icon (symbol, color) by status, created once rather than per paint
+        grey = Color(128, 128, 128)
+        self.status_icons = {
+            'loaded': (u"\u25CF", Color(34, 139, 34)),  # Filled circle, forest green
+            'ejected': (u"\u25CF", grey),  # Filled circle, grey
+            'draft': (u"\u25CF", Color(218, 165, 32)),  # Filled circle, amber/gold
+        }
+        self.unknown_status_icon = (u"\u25CB", grey)  # Hollow circle
+
     def getTableCellRendererComponent(self, table, value, isSelected, hasFocus, row, column):
         component = DefaultTableCellRenderer.getTableCellRendererComponent(
             self, table, value, isSelected, hasFocus, row, column)
@@ -3359,31 +3812,14 @@ class SampleTableCellRenderer(DefaultTableCellRenderer):
         row_data = model.get_row(row)
 
         if row_data:
-            # Set tooltip with detailed info
-            filename = row_data.get('filename', '')
-            created = row_data.get('created', '')
-            users = row_data.get('users', [])
-            users_str = ', '.join(users) if users else 'None'
-
-            tooltip = "<html><b>File:</b> %s<br><b>Created:</b> %s<br><b>Users:</b> %s</html>" % (
-                filename, created[:19] if created else 'Unknown', users_str)
-            component.setToolTipText(tooltip)
+            # Set tooltip with detailed info, built by the model in set_rows
+            component.setToolTipText(model.get_tooltip(row))
 
             # Column 0: Status icon
             if column == 0:
-                status = row_data.get('status', 'unknown')
-                if status == 'loaded':
-                    component.setText(u"\u25CF")  # Filled circle
-                    component.setForeground(Color(34, 139, 34))  # Forest green
-                elif status == 'ejected':
-                    component.setText(u"\u25CF")  # Filled circle
-                    component.setForeground(Color(128, 128, 128))  # Grey
-                elif status == 'draft':
-                    component.setText(u"\u25CF")  # Filled circle
-                    component.setForeground(Color(218, 165, 32))  # Amber/gold
-                else:
-                    component.setText(u"\u25CB")  # Hollow circle
-                    component.setForeground(Color(128, 128, 128))
+                symbol, color = self.status_icons.get(row_data.get('status'), self.unknown_status_icon)
+                component.setText(symbol)
+                component.setForeground(color)
                 component.setHorizontalAlignment(JLabel.CENTER)
             # Column 1: Sample label
             elif column == 1:
@@ -3399,7 +3835,7 @@ class TimelineTableModel(AbstractTableModel):
 
     def __init__(self):
         self.rows = []
-        self.show_holder = False
+        self.show_holder = None  # Unset until first set_rows so columns get configured
         self.column_names = ['Date/Time', 'Sample/Experiment', 'Details']
 
     def getColumnCount(self):
@@ -3411,6 +3847,10 @@ class TimelineTableModel(AbstractTableModel):
     def getColumnName(self, col):
         return self.column_names[col]
 
+    def getColumnClass(self, col):
+        # All cells are strings - lets the row sorter compare them directly
+        return String
+
     def getValueAt(self, row, col):
         if row >= len(self.rows):
             return None
@@ -3435,8 +3875,18 @@ class TimelineTableModel(AbstractTableModel):
         return None
 
     def set_rows(self, rows, show_holder=False):
-        """Replace all rows and set column visibility"""
+        """
+        Replace all rows and set column visibility
+
+        Returns True if the columns changed (so column widths need setting again)
+        """
         self.rows = rows
+
+        if show_holder == self.show_holder:
+            # Same columns - a single data change event is enough
+            self.fireTableDataChanged()
+            return False
+
         self.show_holder = show_holder
 
         # Update column names based on whether holder is shown
@@ -3446,6 +3896,7 @@ class TimelineTableModel(AbstractTableModel):
             self.column_names = ['Date/Time', 'Sample/Experiment', 'Details']
 
         self.fireTableStructureChanged()
+        return True
 
     def clear_rows(self):
         """Clear all rows"""
@@ -3462,6 +3913,11 @@ class TimelineTableCellRenderer(DefaultTableCellRenderer):
         # Simple two-color alternation
         self.color_white = Color.WHITE
         self.color_grey = Color(245, 245, 245)
+        # Highlight and dimensionality colors, created once rather than per paint
+        self.color_orphan = Color(255, 235, 205)  # Peach/light orange warning
+        self.color_selected_sample = Color(255, 252, 230)  # Soft pale yellow
+        self.color_3d = Color(0, 128, 0)  # Green
+        self.color_2d = Color(0, 0, 200)  # Blue
 
     def getTableCellRendererComponent(self, table, value, isSelected, hasFocus, row, column):
         component = DefaultTableCellRenderer.getTableCellRendererComponent(
@@ -3478,10 +3934,10 @@ class TimelineTableCellRenderer(DefaultTableCellRenderer):
 
             # Highlight orphaned experiments with warning color (highest priority)
             if is_orphan:
-                component.setBackground(Color(255, 235, 205))  # Peach/light orange warning
+                component.setBackground(self.color_orphan)
             # Highlight rows matching selected sample (softer yellow)
             elif self.app.selected_sample_filepath and sample_filepath == self.app.selected_sample_filepath:
-                component.setBackground(Color(255, 252, 230))  # Soft pale yellow
+                component.setBackground(self.color_selected_sample)
             else:
                 # Alternate colors by sample using color_index
                 if color_index == 0:
@@ -3504,10 +3960,10 @@ class TimelineTableCellRenderer(DefaultTableCellRenderer):
                 # Color by dimensionality
                 if dimensions >= 3:
                     # 3D+ experiments (green)
-                    component.setForeground(Color(0, 128, 0))
+                    component.setForeground(self.color_3d)
                 elif dimensions == 2:
                     # 2D experiments (blue)
-                    component.setForeground(Color(0, 0, 200))
+                    component.setForeground(self.color_2d)
                 else:
                     # 1D experiments (black)
                     component.setForeground(Color.BLACK)
@@ -3532,17 +3988,15 @@ class BadgeClickListener(MouseAdapter):
         active = self.app._get_active_sample()
         if active:
             # Find this sample in the table and select it
-            sample_files = self.app.sample_io.list_sample_files(self.app.current_directory)
-            for idx, filename in enumerate(sample_files):
-                if filename == active['filename']:
-                    self.app.sample_table.setRowSelectionInterval(idx, idx)
-                    # Scroll to make it visible
-                    self.app.sample_table.scrollRectToVisible(
-                        self.app.sample_table.getCellRect(idx, 0, True)
-                    )
-                    # Switch to Sample Details tab
-                    self.app.tabbed_pane.setSelectedIndex(0)
-                    break
+            idx = self.app.sample_table_model.find_row(active['filename'])
+            if idx >= 0:
+                self.app.sample_table.setRowSelectionInterval(idx, idx)
+                # Scroll to make it visible
+                self.app.sample_table.scrollRectToVisible(
+                    self.app.sample_table.getCellRect(idx, 0, True)
+                )
+                # Switch to Sample Details tab
+                self.app.tabbed_pane.setSelectedIndex(0)
 
 
 class SampleTableMouseListener(MouseAdapter):
@@ -3588,7 +4042,7 @@ class SampleTableMouseListener(MouseAdapter):
 
             # New - always enabled
             item_new = JMenuItem("New...")
-            item_new.addActionListener(lambda e: self.app._new_sample())
+            self.app._bind_action(item_new, 'new_sample')
             popup.add(item_new)
 
             if row >= 0 and row_data and not row_data.get('is_draft', False):
@@ -3596,12 +4050,12 @@ class SampleTableMouseListener(MouseAdapter):
 
                 # Duplicate - enabled when sample is selected
                 item_duplicate = JMenuItem("Duplicate...")
-                item_duplicate.addActionListener(lambda e: self.app._duplicate_sample())
+                self.app._bind_action(item_duplicate, 'duplicate_sample')
                 popup.add(item_duplicate)
 
                 # Edit - enabled when sample is selected
                 item_edit = JMenuItem("Edit")
-                item_edit.addActionListener(lambda e: self.app._edit_sample())
+                self.app._bind_action(item_edit, 'edit_sample')
                 popup.add(item_edit)
 
                 popup.addSeparator()
@@ -3610,13 +4064,13 @@ class SampleTableMouseListener(MouseAdapter):
                 status = row_data.get('status', '')
                 item_eject = JMenuItem("Mark as ejected")
                 item_eject.setEnabled(status == 'loaded')
-                item_eject.addActionListener(lambda e: self.app._eject_active_sample())
+                self.app._bind_action(item_eject, 'eject_active_sample')
                 popup.add(item_eject)
 
                 # Delete - only enabled for ejected samples
                 item_delete = JMenuItem("Delete")
                 item_delete.setEnabled(status == 'ejected')
-                item_delete.addActionListener(lambda e: self.app._delete_sample())
+                self.app._bind_action(item_delete, 'delete_sample')
                 popup.add(item_delete)
 
             popup.show(event.getComponent(), event.getX(), event.getY())
@@ -3668,7 +4122,7 @@ class TimelineMouseListener(MouseAdapter):
             # Create sample from selection - enabled when valid selection
             item_create = JMenuItem("Create sample from selection")
             item_create.setEnabled(can_create_retrospective)
-            item_create.addActionListener(lambda e: self.app._create_sample_from_experiments())
+            self.app._bind_action(item_create, 'create_sample_from_experiments')
             popup.add(item_create)
 
             popup.addSeparator()
@@ -3677,13 +4131,13 @@ class TimelineMouseListener(MouseAdapter):
             # Reassign to previous sample
             item_reassign_prev = JMenuItem("Reassign experiments to previous sample")
             item_reassign_prev.setEnabled(can_reassign_prev)
-            item_reassign_prev.addActionListener(lambda e: self.app._reassign_to_previous_sample())
+            self.app._bind_action(item_reassign_prev, 'reassign_to_previous_sample')
             popup.add(item_reassign_prev)
 
             # Reassign to next sample
             item_reassign_next = JMenuItem("Reassign experiments to next sample")
             item_reassign_next.setEnabled(can_reassign_next)
-            item_reassign_next.addActionListener(lambda e: self.app._reassign_to_next_sample())
+            self.app._bind_action(item_reassign_next, 'reassign_to_next_sample')
             popup.add(item_reassign_next)
 
             # # Reassign to new sample
@@ -3697,18 +4151,32 @@ class TimelineMouseListener(MouseAdapter):
             # View/Edit Sample - enabled when experiment belonging to sample is selected
             item_view = JMenuItem("View/edit sample")
             item_view.setEnabled(can_view_sample)
-            item_view.addActionListener(lambda e: self.app._view_sample_from_timeline())
+            self.app._bind_action(item_view, 'view_sample_from_timeline')
             popup.add(item_view)
 
             # Open Experiment - enabled when experiment is selected
             item_open = JMenuItem("Open experiment in TopSpin")
             item_open.setEnabled(can_open_experiment)
-            item_open.addActionListener(lambda e: self.app._open_experiment_from_timeline())
+            self.app._bind_action(item_open, 'open_experiment_from_timeline')
             popup.add(item_open)
 
             popup.show(event.getComponent(), event.getX(), event.getY())
 
 
+class AppActionDispatcher(ActionListener):
+    """Action listener shared by app buttons and menu items (see _bind_action)
+
+    Calls the app method named by the component's action command, so a
+    single listener serves every component instead of one lambda each.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def actionPerformed(self, event):
+        getattr(self.app, '_' + event.getActionCommand())()
+
+
 class CancelAction(AbstractAction):
     """Action to handle Escape key for cancelling form edits"""
 
@@ -3721,103 +4189,173 @@ class CancelAction(AbstractAction):
 
 
 class CatalogueTableModel(AbstractTableModel):
-    """Table model for sample catalogue"""
+    """Table model for sample catalogue
+
+    Cell values are extracted into one list per column when rows are loaded,
+    and filtering only changes which row indices are visible, so painting and
+    sorting never go back to the row dicts.
+    """
+
+    # Row dict key shown in each column
+    COLUMN_KEYS = ('created', 'experiment', 'label', 'components', 'buffer', 'tube', 'notes', 'users')
+
+    # Columns whose tooltips are shown as HTML, with newlines as line breaks
+    HTML_TOOLTIP_KEYS = ('label', 'components', 'buffer', 'tube', 'notes', 'users')
 
     def __init__(self):
-        self.rows = []
         self.all_rows = []  # Store all rows for filtering
+        self.columns = [[] for _ in self.COLUMN_KEYS]  # Cell values for each of all_rows, by column
+        self.tooltips = [[] for _ in self.COLUMN_KEYS]  # Cell tooltips, laid out as columns
+        self.visible = []  # Indices into all_rows that pass the current filter
+        self.search_index = []  # Lowercase searchable text for each of all_rows
+        self.row_index = {}  # Filepath -> index into all_rows
+        self.search_text = ''  # Current filter, reapplied when rows are replaced
         self.column_names = ['Created', 'Experiment', 'Label', 'Components', 'Buffer', 'Tube', 'Notes', 'Users']
 
     def getColumnCount(self):
         return len(self.column_names)
 
     def getRowCount(self):
-        return len(self.rows)
+        return len(self.visible)
 
     def getColumnName(self, col):
         return self.column_names[col]
 
+    def getColumnClass(self, col):
+        # All cells are strings - lets the row sorter compare them directly
+        return String
+
     def getValueAt(self, row, col):
-        if row >= len(self.rows):
+        if row >= len(self.visible):
             return None
-        row_data = self.rows[row]
-        if col == 0:
-            # Format timestamp - date only, convert UTC to local time
-            created = row_data.get('created', '')
-            if created:
-                try:
-                    import calendar
-                    # Parse UTC timestamp
-                    dt_utc = datetime.strptime(created[:19], "%Y-%m-%dT%H:%M:%S")
-                    # Convert to local time
-                    utc_timestamp = calendar.timegm(dt_utc.timetuple())
-                    dt_local = datetime.fromtimestamp(utc_timestamp)
-                    return dt_local.strftime("%Y-%m-%d")
-                except:
-                    return created[:10]
-            return ''
-        elif col == 1:
-            return row_data.get('experiment', '')
-        elif col == 2:
-            return row_data.get('label', '')
-        elif col == 3:
-            return row_data.get('components', '')
-        elif col == 4:
-            return row_data.get('buffer', '')
-        elif col == 5:
-            return row_data.get('tube', '')
-        elif col == 6:
-            return row_data.get('notes', '')
-        elif col == 7:
-            return row_data.get('users', '')
-        return None
+        return self.columns[col][self.visible[row]]
+
+    def get_tooltip(self, row, col):
+        """Get tooltip text for a cell, or None if it has none"""
+        if row >= len(self.visible):
+            return None
+        return self.tooltips[col][self.visible[row]]
+
+    @classmethod
+    def _format_tooltip(cls, key, tooltip):
+        """Format a row's tooltip text for the column showing key"""
+        if not tooltip:
+            return None
+        if key in cls.HTML_TOOLTIP_KEYS:
+            return "<html>%s</html>" % tooltip.replace('\n', '<br>')
+        return tooltip
+
+    @staticmethod
+    def _format_created(created):
+        """Format timestamp - date only, convert UTC to local time"""
+        if created:
+            try:
+                # Parse UTC timestamp
+                dt_utc = datetime.strptime(created[:19], "%Y-%m-%dT%H:%M:%S")
+                # Convert to local time
+                utc_timestamp = calendar.timegm(dt_utc.timetuple())
+                dt_local = datetime.fromtimestamp(utc_timestamp)
+                return dt_local.strftime("%Y-%m-%d")
+            except:
+                return created[:10]
+        return ''
 
     def get_row(self, row):
         """Get full row data"""
-        if row >= 0 and row < len(self.rows):
-            return self.rows[row]
+        if row >= 0 and row < len(self.visible):
+            return self.all_rows[self.visible[row]]
         return None
 
+    def find_row(self, filepath):
+        """Get visible row number for a sample filepath, or -1 if not shown"""
+        idx = self.row_index.get(filepath)
+        if idx is None:
+            return -1
+        if len(self.visible) == len(self.all_rows):
+            # Unfiltered - visible rows are all_rows in order
+            return idx
+        try:
+            return self.visible.index(idx)
+        except ValueError:
+            return -1
+
     def set_rows(self, rows):
-        """Replace all rows"""
-        self.all_rows = rows
-        self.rows = rows
-        self.fireTableDataChanged()
+        """Replace all rows, keeping the current filter (fires a single change event)"""
+        self._reset()
+        self._extend(rows)
+        self.filter_rows(self.search_text)
+
+    def add_rows(self, rows):
+        """Append rows, keeping the current filter (fires a single insert event)"""
+        start = len(self.all_rows)
+        self._extend(rows)
+
+        added = self._matching(range(start, len(self.all_rows)))
+        if added:
+            first = len(self.visible)
+            self.visible.extend(added)
+            self.fireTableRowsInserted(first, len(self.visible) - 1)
 
     def filter_rows(self, search_text):
         """Filter rows based on search text (supports comma-separated terms)"""
-        if not search_text:
-            self.rows = self.all_rows
-        else:
-            # Split by comma and strip whitespace from each term
-            search_terms = [term.strip().lower() for term in search_text.split(',') if term.strip()]
-
-            self.rows = []
-            for row in self.all_rows:
-                # Search across all text fields
-                searchable = ' '.join([
-                    str(row.get('created', '')),
-                    str(row.get('experiment', '')),
-                    str(row.get('label', '')),
-                    str(row.get('users', '')),
-                    str(row.get('components', '')),
-                    str(row.get('buffer', '')),
-                    str(row.get('tube', '')),
-                    str(row.get('notes', ''))
-                ]).lower()
-
-                # Match if ALL terms are found (AND logic)
-                if all(term in searchable for term in search_terms):
-                    self.rows.append(row)
-
+        self.search_text = search_text
+        self.visible = self._matching(range(len(self.all_rows)))
         self.fireTableDataChanged()
 
     def clear_rows(self):
         """Clear all rows"""
-        self.rows = []
-        self.all_rows = []
+        self._reset()
         self.fireTableDataChanged()
 
+    def _reset(self):
+        """Drop all rows and their extracted values"""
+        self.all_rows = []
+        self.columns = [[] for _ in self.COLUMN_KEYS]
+        self.tooltips = [[] for _ in self.COLUMN_KEYS]
+        self.visible = []
+        self.search_index = []
+        self.row_index = {}
+
+    def _extend(self, rows):
+        """Add rows to all_rows, with their cell values, tooltips and search text"""
+        start = len(self.all_rows)
+        self.all_rows.extend(rows)
+        for offset, row in enumerate(rows):
+            self.row_index.setdefault(row.get('filepath'), start + offset)
+
+        # Extract cell values once per load rather than on every paint
+        for col, key in enumerate(self.COLUMN_KEYS):
+            values = [row.get(key, '') for row in rows]
+            if col == 0:
+                values = [self._format_created(created) for created in values]
+            self.columns[col].extend(values)
+            self.tooltips[col].extend([self._format_tooltip(key, row.get(key + '_tooltip'))
+                                       for row in rows])
+
+        # Build searchable text once per load rather than on every keystroke
+        self.search_index.extend([' '.join([
+            str(row.get('created', '')),
+            str(row.get('experiment', '')),
+            str(row.get('label', '')),
+            str(row.get('users', '')),
+            str(row.get('components', '')),
+            str(row.get('buffer', '')),
+            str(row.get('tube', '')),
+            str(row.get('notes', ''))
+        ]).lower() for row in rows])
+
+    def _matching(self, indices):
+        """Get the row indices that match the current search text"""
+        # Split by comma and strip whitespace from each term
+        search_terms = [term.strip().lower() for term in self.search_text.split(',') if term.strip()]
+        if not search_terms:
+            return list(indices)
+
+        # Match if ALL terms are found (AND logic)
+        search_index = self.search_index
+        return [idx for idx in indices
+                if all(term in search_index[idx] for term in search_terms)]
+
 
 class CatalogueTableCellRenderer(DefaultTableCellRenderer):
     """Custom cell renderer for catalogue table with tooltips"""
@@ -3826,85 +4364,36 @@ class CatalogueTableCellRenderer(DefaultTableCellRenderer):
         component = DefaultTableCellRenderer.getTableCellRendererComponent(
             self, table, value, isSelected, hasFocus, row, column)
 
-        # Get actual row in model (in case table is sorted)
+        # Get actual row and column in model (in case table is sorted or columns moved)
         model_row = table.convertRowIndexToModel(row)
-        model = table.getModel()
-        row_data = model.get_row(model_row)
-
-        if row_data:
-            # Set tooltips based on column
-            col_name = model.getColumnName(column)
-
-            if col_name == 'Label':
-                tooltip = row_data.get('label_tooltip', '')
-                if tooltip:
-                    component.setToolTipText("<html>%s</html>" % tooltip.replace('\n', '<br>'))
-                else:
-                    component.setToolTipText(None)
-
-            elif col_name == 'Components':
-                tooltip = row_data.get('components_tooltip', '')
-                if tooltip:
-                    component.setToolTipText("<html>%s</html>" % tooltip.replace('\n', '<br>'))
-                else:
-                    component.setToolTipText(None)
-
-            elif col_name == 'Buffer':
-                tooltip = row_data.get('buffer_tooltip', '')
-                if tooltip:
-                    component.setToolTipText("<html>%s</html>" % tooltip.replace('\n', '<br>'))
-                else:
-                    component.setToolTipText(None)
-
-            elif col_name == 'Tube':
-                tooltip = row_data.get('tube_tooltip', '')
-                if tooltip:
-                    component.setToolTipText("<html>%s</html>" % tooltip.replace('\n', '<br>'))
-                else:
-                    component.setToolTipText(None)
-
-            elif col_name == 'Notes':
-                tooltip = row_data.get('notes_tooltip', '')
-                if tooltip:
-                    # Escape HTML and preserve newlines
-                    component.setToolTipText("<html>%s</html>" % tooltip.replace('\n', '<br>'))
-                else:
-                    component.setToolTipText(None)
-
-            elif col_name == 'Users':
-                tooltip = row_data.get('users_tooltip', '')
-                if tooltip:
-                    component.setToolTipText("<html>%s</html>" % tooltip.replace('\n', '<br>'))
-                else:
-                    component.setToolTipText(None)
-
-            elif col_name == 'Experiment':
-                tooltip = row_data.get('experiment_tooltip', '')
-                if tooltip:
-                    component.setToolTipText(tooltip)
-                else:
-                    component.setToolTipText(None)
-
-            else:
-                component.setToolTipText(None)
+        model_column = table.convertColumnIndexToModel(column)
+        component.setToolTipText(table.getModel().get_tooltip(model_row, model_column))
 
         return component
 
 
 class CatalogueSearchListener(DocumentListener):
-    """Document listener for catalogue search field"""
+    """Document listener for catalogue search field
+
+    Filtering is delayed until typing pauses, so a burst of keystrokes
+    filters the catalogue once rather than once per character.
+    """
+
+    FILTER_DELAY_MS = 300
 
     def __init__(self, app):
         self.app = app
+        self.timer = Timer(self.FILTER_DELAY_MS, lambda e: self._update_filter())
+        self.timer.setRepeats(False)
 
     def insertUpdate(self, event):
-        self._update_filter()
+        self.timer.restart()
 
     def removeUpdate(self, event):
-        self._update_filter()
+        self.timer.restart()
 
     def changedUpdate(self, event):
-        self._update_filter()
+        self.timer.restart()
 
     def _update_filter(self):
         """Apply search filter"""
@@ -3981,14 +4470,12 @@ class CatalogueMouseListener(MouseAdapter):
             self.app.set_directory(directory, auto_select=False)
 
             # Find and select the sample in the list
-            sample_files = self.app.sample_io.list_sample_files(directory)
-            for idx, f in enumerate(sample_files):
-                if f == filename:
-                    self.app.current_sample_file = filename
-                    self.app.sample_table.setRowSelectionInterval(idx, idx)
-                    # Trigger edit mode
-                    self.app._edit_sample()
-                    break
+            idx = self.app.sample_table_model.find_row(filename)
+            if idx >= 0:
+                self.app.current_sample_file = filename
+                self.app.sample_table.setRowSelectionInterval(idx, idx)
+                # Trigger edit mode
+                self.app._edit_sample()
 
     def _duplicate_sample(self, sample_info):
         """Duplicate sample into current directory"""
@@ -4004,7 +4491,7 @@ class CatalogueMouseListener(MouseAdapter):
 
         try:
             # Read the sample data
-            data = self.app.sample_io.read_sample(filepath)
+            data = self.app._read_catalogue_sample(sample_info)
 
             # Append "(copy)" to label
             if 'sample' in data and 'label' in data['sample']:
@@ -4032,8 +4519,8 @@ class CatalogueMouseListener(MouseAdapter):
 
                 # Eject the active sample
                 self.app.sample_io.eject_sample(active['filepath'])
-                self.app._refresh_sample_list()
-                self.app._refresh_timeline()
+                self.app._invalidate_timeline()
+                self.app._refresh_timeline_later()
 
             # Set draft state
             self.app.current_sample_file = None
@@ -4049,15 +4536,12 @@ class CatalogueMouseListener(MouseAdapter):
             self.app.form_generator = SchemaFormGenerator(self.app.current_schema_path)
 
             # Create form first
-            self.app.form_panel.removeAll()
             form_scroll = self.app.form_generator.create_form_panel(self.app)
-            self.app.form_panel.add(form_scroll, BorderLayout.CENTER)
 
             # Then load data
             self.app.form_generator.load_data(data)
 
-            self.app.form_panel.revalidate()
-            self.app.form_panel.repaint()
+            self.app._set_form_content(form_scroll)
 
             # Set button states
             self.app.btn_save.setEnabled(False)
@@ -4100,7 +4584,7 @@ class SettingsDialog(JDialog):
         info_label = JLabel("<html>These directories will be searched for samples.<br>" +
                            "Subdirectories will be searched recursively.</html>")
         info_label.setFont(info_label.getFont().deriveFont(Font.PLAIN, 11.0))
-        info_label.setForeground(Color(100, 100, 100))
+        info_label.setForeground(DETAIL_TEXT_COLOR)
         center_panel.add(info_label, BorderLayout.NORTH)
 
         # List of directories
@@ -4134,7 +4618,7 @@ class SettingsDialog(JDialog):
 
         # Make OK button visually primary
         btn_ok.setFont(btn_ok.getFont().deriveFont(Font.BOLD))
-        btn_ok.setBackground(Color(200, 230, 200))
+        btn_ok.setBackground(PRIMARY_BUTTON_COLOR)
         btn_ok.setOpaque(True)
 
         bottom_panel.add(btn_cancel)
@@ -4196,12 +4680,11 @@ class SettingsDialog(JDialog):
         self.dispose()
 
 
-def get_app():
-    """Get or create the application singleton"""
-    app = System.getProperties().get(APP_KEY)
-
-    if app is None:
-        # No existing app - reload modules to get fresh code
+def _fresh_app():
+    """Create a new application instance and store it as the singleton"""
+    # Reloading library modules is only useful while developing them, and is
+    # slow under Jython, so it is opt-in
+    if os.environ.get('TOPSPIN_SAMPLES_RELOAD'):
         try:
             import sample_io
             import schema_form
@@ -4212,28 +4695,28 @@ def get_app():
         except:
             pass
 
-        # Create new instance
-        app = SampleManagerApp()
-        System.getProperties().put(APP_KEY, app)
+    app = SampleManagerApp()
+    System.getProperties().put(APP_KEY, app)
+    # Build the window only once the singleton is registered, so that
+    # callbacks from EXEC_PYSCRIPT can find it
+    app.build_gui()
+    return app
+
+
+def get_app():
+    """Get or create the application singleton"""
+    app = System.getProperties().get(APP_KEY)
+
+    if app is None:
+        # No existing app - create new instance
+        app = _fresh_app()
+    elif not hasattr(app, 'show'):
+        # Version check for code updates - old version, replace it
+        app = _fresh_app()
     else:
-        # Version check for code updates
-        if not hasattr(app, 'show'):
-            # Old version - replace it
-            try:
-                import sample_io
-                import schema_form
-                import timeline
-                reload(sample_io)
-                reload(schema_form)
-                reload(timeline)
-            except:
-                pass
-            app = SampleManagerApp()
-            System.getProperties().put(APP_KEY, app)
-        else:
-            # Show existing instance and navigate to current dataset
-            app.show()
-            app._navigate_to_curdata()
+        # Show existing instance and navigate to current dataset
+        app.show()
+        app._navigate_to_curdata()
 
     return app
 